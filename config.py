@@ -79,6 +79,10 @@ class AppConfig(BaseModel):
     # Project graph persistence (big-picture structure + call graph)
     project_graph_sqlite_path: str = "./project_graph.sqlite3"
 
+    # Optional parse cache (SQLite). When set, parsed Java methods are cached per file
+    # (keyed by path + content hash) so re-indexing skips unchanged files.
+    parse_cache_sqlite_path: Optional[str] = None
+
     # LLM configuration (for embeddings + chat).
     # This repo currently uses embeddings (Chroma + OpenAIEmbeddings) and may
     # also use a chat model for answer generation.
@@ -7,7 +7,7 @@ from typing import Any, Dict, List, Sequence, Tuple
 from langchain_core.messages import HumanMessage, SystemMessage
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LLMCallResult:
     """A small wrapper for normalized LLM responses.
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 from dataclasses import dataclass
@@ -8,8 +9,13 @@ from typing import Any, Dict, List, Mapping, Sequence, Tuple
 
 from langchain_core.messages import HumanMessage, SystemMessage
 
+# Compiled once at import; these run for every LLM response / feature page.
+_JSON_LIST_RE = re.compile(r"\[[\s\S]*\]")
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
+_SLUG_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class LLMCallResult:
     """A small wrapper for normalized LLM responses.
 
@@ -66,6 +72,67 @@ def _invoke_llm(llm: Any, messages: Sequence[Any]) -> LLMCallResult:
     return LLMCallResult(content=_coerce_llm_content(response).strip())
 
 
+async def _ainvoke_llm(llm: Any, messages: Sequence[Any]) -> LLMCallResult:
+    """Async counterpart of `_invoke_llm`.
+
+    Uses the model's native `.ainvoke()` when available, otherwise runs the blocking
+    call in a worker thread.
+    """
+
+    if hasattr(llm, "ainvoke"):
+        response = await llm.ainvoke(list(messages))
+        return LLMCallResult(content=_coerce_llm_content(response).strip())
+
+    return await asyncio.to_thread(_invoke_llm, llm, messages)
+
+
+async def _ainvoke_many(
+    llm: Any,
+    messages_list: Sequence[Sequence[Any]],
+    *,
+    max_concurrency: int,
+) -> List[LLMCallResult]:
+    """Run independent prompts concurrently, at most `max_concurrency` at a time.
+
+    Returns:
+        Results in the same order as `messages_list`.
+    """
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _one(messages: Sequence[Any]) -> LLMCallResult:
+        async with semaphore:
+            return await _ainvoke_llm(llm, messages)
+
+    return list(await asyncio.gather(*(_one(m) for m in messages_list)))
+
+
+def _invoke_llm_many(
+    llm: Any,
+    messages_list: Sequence[Sequence[Any]],
+    *,
+    max_concurrency: int,
+) -> List[LLMCallResult]:
+    """Invoke the model for several independent prompts, overlapping their latency.
+
+    Falls back to sequential calls when there is a single prompt, concurrency is
+    disabled, or an event loop is already running in this thread.
+
+    Returns:
+        Results in the same order as `messages_list`.
+    """
+
+    if len(messages_list) <= 1 or max_concurrency <= 1:
+        return [_invoke_llm(llm, m) for m in messages_list]
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_ainvoke_many(llm, messages_list, max_concurrency=max_concurrency))
+
+    return [_invoke_llm(llm, m) for m in messages_list]
+
+
 def _truncate_middle(text: str, *, max_chars: int) -> str:
     """Truncate text by keeping the beginning and end.
 
@@ -93,6 +160,25 @@ def _truncate_middle(text: str, *, max_chars: int) -> str:
     return prefix + "\n\n/* --- TRUNCATED FOR TOKEN LIMITS --- */\n\n" + suffix
 
 
+def _fetch_summaries(file_summaries: Mapping[str, str], file_paths: Sequence[str]) -> List[str]:
+    """Fetch the summaries of `file_paths`, in order, skipping unknown paths.
+
+    Disk-backed stores (see `FileSummaryStore`) expose `mget` and answer in one call.
+
+    Args:
+        file_summaries: Mapping of file path -> file summary markdown.
+        file_paths: Paths to look up.
+
+    Returns:
+        Summaries for the paths that exist.
+    """
+
+    mget = getattr(file_summaries, "mget", None)
+    if callable(mget):
+        return mget(file_paths)
+    return [file_summaries[p] for p in file_paths if p in file_summaries]
+
+
 def _extract_json_array(text: str) -> List[str]:
     """Parse a JSON array of strings from raw model output.
 
@@ -117,7 +203,7 @@ def _extract_json_array(text: str) -> List[str]:
     except Exception:
         pass
 
-    match = re.search(r"\[[\s\S]*\]", raw)
+    match = _JSON_LIST_RE.search(raw)
     if not match:
         raise ValueError("Could not find a JSON list in model output")
 
@@ -162,7 +248,7 @@ def _extract_json_object(text: str) -> Dict[str, str]:
     except Exception:
         pass
 
-    match = re.search(r"\{[\s\S]*\}", raw)
+    match = _JSON_OBJECT_RE.search(raw)
     if not match:
         raise ValueError("Could not find a JSON object in model output")
 
@@ -193,8 +279,8 @@ def _slugify_feature_name(name: str) -> str:
     """
 
     s = (name or "").strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-+", "-", s).strip("-")
+    # Runs of separators collapse to a single "-", so no second pass is needed.
+    s = _SLUG_SEPARATOR_RE.sub("-", s).strip("-")
     return s or "feature"
 
 
@@ -213,10 +299,13 @@ def _extract_file_titles_from_summaries(summaries: Sequence[str]) -> List[str]:
 
     results: List[str] = []
     for summary in summaries:
-        first_line = (summary or "").lstrip().splitlines()[0] if (summary or "").strip() else ""
+        # Only the first line matters; partition avoids splitting the whole summary.
+        first_line = (summary or "").lstrip().partition("\n")[0]
         if first_line.startswith("## "):
-            results.append(first_line[3:].strip())
-    return [x for x in results if x]
+            title = first_line[3:].strip()
+            if title:
+                results.append(title)
+    return results
 
 
 class DocumentationSiteGenerator:
@@ -234,6 +323,7 @@ class DocumentationSiteGenerator:
         *,
         batch_size: int = 10,
         max_input_chars: int = 60_000,
+        max_concurrency: int = 8,
     ) -> None:
         """Create a generator.
 
@@ -241,6 +331,8 @@ class DocumentationSiteGenerator:
             llm: LangChain chat model to use.
             batch_size: Number of files to classify per LLM call.
             max_input_chars: Maximum characters to send to the model per request.
+            max_concurrency: Maximum number of independent LLM requests in flight
+                (classification batches, feature pages). 1 disables concurrency.
 
         Raises:
             ValueError: If `batch_size` is not positive.
@@ -251,6 +343,7 @@ class DocumentationSiteGenerator:
         self._llm = llm
         self._batch_size = int(batch_size)
         self._max_input_chars = int(max_input_chars)
+        self._max_concurrency = int(max_concurrency)
 
     def generate_feature_list(self, project_overview: str) -> List[str]:
         """Generate a list of top-level features from the project overview.
@@ -320,10 +413,12 @@ class DocumentationSiteGenerator:
         if not features:
             raise ValueError("feature_list must not be empty")
 
-        files = [(k, v) for k, v in (file_summaries or {}).items() if (k or "").strip()]
-        batches: List[List[Tuple[str, str]]] = []
-        for i in range(0, len(files), self._batch_size):
-            batches.append(files[i : i + self._batch_size])
+        # Only the paths are listed up front; summaries are fetched one batch at a time.
+        file_summaries = file_summaries or {}
+        file_paths = [k for k in file_summaries if (k or "").strip()]
+        batches: List[List[str]] = []
+        for i in range(0, len(file_paths), self._batch_size):
+            batches.append(file_paths[i : i + self._batch_size])
 
         assignments: Dict[str, str] = {}
 
@@ -335,9 +430,11 @@ class DocumentationSiteGenerator:
             )
         )
 
-        for batch in batches:
+        features_json = json.dumps(features, ensure_ascii=False)
+
+        def _request(batch: Sequence[str]) -> List[Any]:
             payload_items: List[Dict[str, str]] = []
-            for path, summary in batch:
+            for path, summary in zip(batch, _fetch_summaries(file_summaries, batch)):
                 payload_items.append(
                     {
                         "file": path,
@@ -349,23 +446,29 @@ class DocumentationSiteGenerator:
                 content=(
                     "Classify each file into the single most relevant feature.\n\n"
                     "FEATURE LIST:\n"
-                    f"{json.dumps(features, ensure_ascii=False)}\n\n"
+                    f"{features_json}\n\n"
                     "FILES (JSON array of objects with fields 'file' and 'summary'):\n"
                     f"{json.dumps(payload_items, ensure_ascii=False)}\n\n"
                     "Return a JSON object mapping file -> feature. "
                     "Each value MUST be one of the provided features."
                 )
             )
+            return [system, human]
 
-            raw = _invoke_llm(self._llm, [system, human]).content
-            parsed = _extract_json_object(raw)
+        # Batches are independent: classify them concurrently, merge in batch order.
+        # Requests are built a window at a time so only that window's prompts are held.
+        window = max(1, self._max_concurrency)
+        for start in range(0, len(batches), window):
+            requests = [_request(batch) for batch in batches[start : start + window]]
+            for result in _invoke_llm_many(self._llm, requests, max_concurrency=self._max_concurrency):
+                parsed = _extract_json_object(result.content)
 
-            for file_path, feature in parsed.items():
-                assignments[file_path] = (feature or "").strip()
+                for file_path, feature in parsed.items():
+                    assignments[file_path] = (feature or "").strip()
 
         # Ensure every file got assigned.
         default_feature = features[0]
-        for file_path, _summary in files:
+        for file_path in file_paths:
             if file_path not in assignments or assignments[file_path] not in features:
                 assignments[file_path] = default_feature
 
@@ -390,8 +493,44 @@ class DocumentationSiteGenerator:
             Markdown page contents.
         """
 
+        name, summaries = self._normalize_page_inputs(feature_name, related_file_summaries)
+        body = _invoke_llm(self._llm, self._feature_page_messages(name, summaries)).content
+        return self._render_feature_page(name, summaries, body)
+
+    def generate_feature_pages(
+        self,
+        features: Sequence[Tuple[str, Sequence[str]]],
+    ) -> List[str]:
+        """Generate several feature pages, overlapping the LLM calls.
+
+        Args:
+            features: (feature name, related file summaries) pairs.
+
+        Returns:
+            Markdown page contents, in the same order as `features`.
+        """
+
+        inputs = [self._normalize_page_inputs(name, summaries) for name, summaries in features]
+        results = _invoke_llm_many(
+            self._llm,
+            [self._feature_page_messages(name, summaries) for name, summaries in inputs],
+            max_concurrency=self._max_concurrency,
+        )
+        return [
+            self._render_feature_page(name, summaries, result.content)
+            for (name, summaries), result in zip(inputs, results)
+        ]
+
+    @staticmethod
+    def _normalize_page_inputs(
+        feature_name: str,
+        related_file_summaries: Sequence[str],
+    ) -> Tuple[str, List[str]]:
         name = (feature_name or "").strip() or "Feature"
         summaries = [s.strip() for s in (related_file_summaries or []) if (s or "").strip()]
+        return name, summaries
+
+    def _feature_page_messages(self, name: str, summaries: Sequence[str]) -> List[Any]:
         joined = _truncate_middle("\n\n".join(summaries), max_chars=self._max_input_chars)
 
         system = SystemMessage(
@@ -428,7 +567,11 @@ class DocumentationSiteGenerator:
             )
         )
 
-        body = _invoke_llm(self._llm, [system, human]).content.strip()
+        return [system, human]
+
+    @staticmethod
+    def _render_feature_page(name: str, summaries: Sequence[str], body: str) -> str:
+        body = (body or "").strip()
         if not body:
             body = "_No content generated._"
 
@@ -465,6 +608,7 @@ def write_feature_docs_site(
     file_summaries: Mapping[str, str],
     llm: Any,
     batch_size: int = 10,
+    max_concurrency: int = 8,
 ) -> Dict[str, Path]:
     """Generate a feature-based docs site on disk.
 
@@ -474,12 +618,13 @@ def write_feature_docs_site(
         file_summaries: Mapping of file path -> file summary markdown.
         llm: LangChain chat model.
         batch_size: Batch size for file-to-feature mapping.
+        max_concurrency: Maximum number of concurrent LLM requests.
 
     Returns:
         Mapping of feature name -> path of generated feature page.
     """
 
-    generator = DocumentationSiteGenerator(llm, batch_size=batch_size)
+    generator = DocumentationSiteGenerator(llm, batch_size=batch_size, max_concurrency=max_concurrency)
     features = generator.generate_feature_list(project_overview)
     mapping = generator.map_files_to_features(file_summaries, features)
 
@@ -487,14 +632,21 @@ def write_feature_docs_site(
     features_dir = output_dir / "features"
     features_dir.mkdir(parents=True, exist_ok=True)
 
+    # Pages are generated concurrently, a window at a time so only that window's
+    # summaries are held in memory.
+    items = list(mapping.items())
+    window = max(1, max_concurrency)
     feature_paths: Dict[str, Path] = {}
-    for feature_name, file_paths in mapping.items():
-        summaries = [file_summaries[p] for p in file_paths if p in file_summaries]
-        page = generator.generate_feature_page(feature_name, summaries)
-        file_name = generator.feature_filename(feature_name)
-        page_path = features_dir / file_name
-        page_path.write_text(page, encoding="utf-8")
-        feature_paths[feature_name] = page_path
+    for start in range(0, len(items), window):
+        chunk = items[start : start + window]
+        pages = generator.generate_feature_pages(
+            [(feature_name, _fetch_summaries(file_summaries, file_paths)) for feature_name, file_paths in chunk]
+        )
+        for (feature_name, _file_paths), page in zip(chunk, pages):
+            file_name = generator.feature_filename(feature_name)
+            page_path = features_dir / file_name
+            page_path.write_text(page, encoding="utf-8")
+            feature_paths[feature_name] = page_path
 
     # Keep the consolidated overview next to the site index so links resolve cleanly.
     # This matches the user's expectation: docs/PROJECT_OVERVIEW.md lives alongside docs/features/.
@@ -511,9 +663,9 @@ def write_feature_docs_site(
     index_lines.append("\n## Project Overview\n")
     index_lines.append("The consolidated overview is available at [PROJECT_OVERVIEW.md](PROJECT_OVERVIEW.md).\n")
     index_lines.append("\n## Features\n")
-    for feature_name in sorted(feature_paths.keys(), key=lambda s: s.lower()):
-        slug = generator.feature_filename(feature_name)
-        index_lines.append(f"- [{feature_name}](features/{slug})")
+    # Link to the pages written above rather than re-deriving each filename.
+    for feature_name, page_path in sorted(feature_paths.items(), key=lambda kv: kv[0].lower()):
+        index_lines.append(f"- [{feature_name}](features/{page_path.name})")
 
     (output_dir / "index.md").write_text("\n".join(index_lines).strip() + "\n", encoding="utf-8")
 
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import shelve
+import tempfile
+from collections.abc import Iterable, Iterator, MutableMapping
+from pathlib import Path
+from types import TracebackType
+from typing import Optional
+
+
+class FileSummaryStore(MutableMapping[str, str]):
+    """Disk-backed mapping of file path -> file summary markdown.
+
+    Documentation generation keeps one summary per Java file for the whole run.
+    On large repositories holding all of them in a dict dominates peak memory, so
+    this store spills them to a `shelve` database in a private temporary directory.
+    Only the summaries currently being aggregated (one folder or one feature) are
+    loaded back into memory.
+
+    The store is a drop-in `Mapping` for `write_feature_docs_site()` and the
+    module/project summary helpers.
+    """
+
+    def __init__(self, *, directory: Optional[str] = None) -> None:
+        """Create an empty store.
+
+        Args:
+            directory: Optional parent directory for the temporary database.
+                Defaults to the system temporary directory.
+        """
+
+        self._tmpdir = tempfile.TemporaryDirectory(prefix="open-deepwiki-summaries-", dir=directory)
+        self._db: Optional[shelve.Shelf[str]] = shelve.open(
+            str(Path(self._tmpdir.name) / "summaries.db"),
+            flag="n",
+        )
+
+    def _shelf(self) -> shelve.Shelf[str]:
+        if self._db is None:
+            raise ValueError("FileSummaryStore is closed")
+        return self._db
+
+    def __getitem__(self, key: str) -> str:
+        return self._shelf()[key]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self._shelf()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._shelf()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._shelf().keys()))
+
+    def __len__(self) -> int:
+        return len(self._shelf())
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key in self._shelf()
+
+    def mget(self, keys: Iterable[str]) -> list[str]:
+        """Fetch the summaries for several paths in one call.
+
+        Args:
+            keys: File paths to look up. Missing paths are skipped.
+
+        Returns:
+            Summaries for the paths that exist, in the order requested.
+        """
+
+        shelf = self._shelf()
+        out: list[str] = []
+        for key in keys:
+            value = shelf.get(key)
+            if value is not None:
+                out.append(value)
+        return out
+
+    def close(self) -> None:
+        """Close the database and delete its temporary directory.
+
+        Safe to call more than once.
+        """
+
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        self._tmpdir.cleanup()
+
+    def __enter__(self) -> "FileSummaryStore":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
@@ -14,6 +15,25 @@ from langchain_core.documents import Document
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=8)
+def _get_splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    """Return a shared token-based splitter for the given chunking settings.
+
+    Building the splitter loads the tiktoken encoding, so it is done once per
+    (chunk_size, chunk_overlap) rather than once per file.
+    """
+
+    # Use tiktoken encoder for accurately respecting token limits if possible,
+    # otherwise default length function (characters).
+    # We assume cl100k_base (OpenAI) as default encoding usually.
+    return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        encoding_name="cl100k_base",
+    )
+
+
 class GenericAppParser:
     """Parser for generic resource files (YAML, JSON, XML, MD, etc.).
     
@@ -31,31 +51,31 @@ class GenericAppParser:
         Returns:
             List of LangChain Documents.
         """
+        # Read raw bytes once and decode in memory; the latin-1 fallback reuses them.
         try:
-            text = file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            try:
-                # Fallback to latin-1 if utf-8 fails
-                text = file_path.read_text(encoding="latin-1")
-            except Exception as e:
-                logger.warning(f"Failed to read file {file_path}: {e}")
-                return []
+            with open(file_path, "rb") as f:
+                raw = f.read()
         except Exception as e:
             logger.warning(f"Failed to read file {file_path}: {e}")
             return []
 
+        if not raw:
+            return []
+
+        try:
+            text = raw.decode("utf-8")
+        except UnicodeDecodeError:
+            # Fallback to latin-1 if utf-8 fails
+            text = raw.decode("latin-1")
+
+        # Match read_text()'s universal-newline handling.
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+
         if not text.strip():
             return []
 
-        # Use tiktoken encoder for accurately respecting token limits if possible,
-        # otherwise default length function (characters).
-        # We assume cl100k_base (OpenAI) as default encoding usually.
-        splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            encoding_name="cl100k_base" 
-        )
-        
+        splitter = _get_splitter(int(chunk_size), int(chunk_overlap))
         chunks = splitter.split_text(text)
         
         docs = []
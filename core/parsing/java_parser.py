@@ -1,14 +1,132 @@
 from __future__ import annotations
 
+import hashlib
+import logging
 import os
 import re
+import sys
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+# Single tree-sitter query used by JavaParser: one pass collects the package name,
+# every method/constructor declaration and every call site (see `_scan_file`).
+# Compiled once per process (see JavaParser._query).
+_FILE_QUERY = """
+(package_declaration
+    (scoped_identifier) @pkg)
+(method_declaration) @method
+(constructor_declaration) @constructor
+(method_invocation
+    name: (identifier) @call_name)
+"""
+
+# Method ID normalization: drop punctuation, then fold separators into single "_".
+_ID_DROP_RE = re.compile(r"[^\w\s:\-./]+")
+_ID_SEPARATOR_RE = re.compile(r"[\s:\-./_]+")
+
+# Capture name -> JavaMethod.type for declarations matched by _FILE_QUERY.
+_DECLARATION_KINDS = {"method": "method", "constructor": "constructor"}
+
+# Declaration children that make up the extracted signature, in source order.
+_SIGNATURE_CHILD_TYPES = frozenset(
+    {"modifiers", "type_identifier", "void_type", "generic_type", "identifier", "formal_parameters"}
+)
+
+# Node types whose `identifier` child names the enclosing type of a method.
+_TYPE_DECLARATION_NODES = frozenset(
+    {
+        "class_declaration",
+        "interface_declaration",
+        "enum_declaration",
+        "record_declaration",
+        "annotation_type_declaration",
+    }
+)
+
+# Javadoc block that ends right before a declaration (fallback scan in _extract_javadoc).
+_JAVADOC_TAIL_RE = re.compile(rb"(/\*\*.*?\*/)\s*\Z", re.DOTALL)
+
+
+def _normalize_id(raw: str) -> str:
+    """Turn a raw "pkg::Type::signature::..." string into a lowercase, filesystem-safe ID.
+
+    Characters other than word characters, whitespace and ``: - . /`` are dropped;
+    runs of whitespace, ``: - . /`` and ``_`` collapse to a single ``_``.
+
+    Args:
+        raw: Joined ID parts.
+
+    Returns:
+        Normalized identifier.
+    """
+
+    cleaned = _ID_DROP_RE.sub("", raw)
+    return _ID_SEPARATOR_RE.sub("_", cleaned).strip("_").lower()
+
+
+def _common_prefix_len(a: bytes, b: bytes) -> int:
+    """Length of the common prefix of `a` and `b` (binary search over slice compares)."""
+
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_len(a: bytes, b: bytes, limit: int) -> int:
+    """Length of the common suffix of `a` and `b`, at most `limit` bytes."""
+
+    lo, hi = 0, min(len(a), len(b), limit)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid :] == b[len(b) - mid :]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _point_at(data: bytes, offset: int) -> Tuple[int, int]:
+    """tree-sitter (row, byte column) of byte `offset` in `data`."""
+
+    row = data.count(b"\n", 0, offset)
+    return row, offset - (data.rfind(b"\n", 0, offset) + 1)
+
+
+def _apply_edit(tree: Any, old_bytes: bytes, new_bytes: bytes) -> None:
+    """Describe the change from `old_bytes` to `new_bytes` to `tree` as one edit."""
+
+    start = _common_prefix_len(old_bytes, new_bytes)
+    suffix = _common_suffix_len(old_bytes, new_bytes, min(len(old_bytes), len(new_bytes)) - start)
+    old_end = len(old_bytes) - suffix
+    new_end = len(new_bytes) - suffix
+    tree.edit(
+        start_byte=start,
+        old_end_byte=old_end,
+        new_end_byte=new_end,
+        start_point=_point_at(old_bytes, start),
+        old_end_point=_point_at(old_bytes, old_end),
+        new_end_point=_point_at(new_bytes, new_end),
+    )
+
+
+@dataclass(slots=True)
 class JavaMethod:
-    """Represents a parsed Java method or constructor."""
+    """Represents a parsed Java method or constructor.
+
+    Slotted: one instance is created per method across the whole codebase. Not frozen,
+    because scanners fill in context (e.g. `project`) after parsing.
+    """
 
     id: str
     signature: str
@@ -24,11 +142,26 @@ class JavaMethod:
 
 
 class JavaParser:
-    """Parser for Java code using tree-sitter."""
+    """Parser for Java code using tree-sitter.
+
+    The compiled `Language` is loaded once per process and shared by all instances.
+    tree-sitter `Parser` objects are not thread-safe, so each thread lazily gets its
+    own (see `parser`); a single JavaParser can therefore be used from a thread pool.
+    """
+
+    _LIB_PATH = "build/java-languages.so"
+    # Max number of parsed trees kept for re-scans (see `_parse_tree`).
+    TREE_CACHE_SIZE = 256
+    # Sources larger than this (in characters) are skipped: they are almost always
+    # generated code and dominate parse time without adding useful methods.
+    MAX_SOURCE_CHARS = 5_000_000
+    _language: Any = None
+    _language_lock = threading.Lock()
+    # Compiled queries are bound to the shared language and safe to use from any thread.
+    _queries: Dict[str, Any] = {}
 
     def __init__(self):
-        lib_path = "build/java-languages.so"
-        if not os.path.exists(lib_path):
+        if not os.path.exists(self._LIB_PATH):
             raise RuntimeError(
                 "Tree-sitter Java language library not found at 'build/java-languages.so'. "
                 "Run setup_java_language() to build it first."
@@ -36,12 +169,100 @@ class JavaParser:
 
         # Delay tree-sitter imports so other modules can be imported without it.
         import tree_sitter  # type: ignore
-        from tree_sitter import Language, Parser  # type: ignore
 
         self._tree_sitter = tree_sitter
-        self.java_language = Language(lib_path, "java")
-        self.parser = Parser()
-        self.parser.set_language(self.java_language)
+        self.java_language = self._get_language()
+        self._local = threading.local()
+        # file_path -> (content digest, source bytes, tree); LRU-ordered, oldest first.
+        # The source is kept so a changed file can be re-parsed incrementally.
+        self._tree_cache: "OrderedDict[str, Tuple[bytes, bytes, Any]]" = OrderedDict()
+        self._tree_cache_lock = threading.Lock()
+
+    @classmethod
+    def _get_language(cls) -> Any:
+        """Load the Java grammar from the shared library once per process."""
+
+        if cls._language is None:
+            with cls._language_lock:
+                if cls._language is None:
+                    from tree_sitter import Language  # type: ignore
+
+                    cls._language = Language(cls._LIB_PATH, "java")
+        return cls._language
+
+    @classmethod
+    def _query(cls, source: str) -> Any:
+        """Return the compiled query for `source`, compiling it on first use."""
+
+        query = cls._queries.get(source)
+        if query is None:
+            with cls._language_lock:
+                query = cls._queries.get(source)
+                if query is None:
+                    query = cls._get_language().query(source)
+                    cls._queries[source] = query
+        return query
+
+    @property
+    def parser(self) -> Any:
+        """tree-sitter Parser owned by the calling thread."""
+
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            from tree_sitter import Parser  # type: ignore
+
+            parser = Parser()
+            parser.set_language(self.java_language)
+            self._local.parser = parser
+        return parser
+
+    def _parse_tree(self, code_bytes: bytes, file_path: Optional[str]) -> Any:
+        """Parse `code_bytes`, reusing the cached tree when a file is re-scanned.
+
+        An unchanged file returns the cached tree as-is. A changed file is re-parsed
+        incrementally: the differing byte range is applied to the previous tree with
+        `Tree.edit()` and tree-sitter reuses every untouched subtree.
+
+        The cache lives on the instance, so this only pays off for a long-lived parser
+        (the indexing service keeps one on `app_state`). With a parse cache in front,
+        unchanged files rarely reach this point and the common hit is the incremental
+        re-parse of files edited since the previous index job.
+
+        Args:
+            code_bytes: UTF-8 encoded Java source.
+            file_path: Optional source path used as the cache key. Without it the
+                source is always parsed from scratch.
+
+        Returns:
+            A tree-sitter Tree.
+        """
+
+        if not file_path:
+            return self.parser.parse(code_bytes)
+
+        digest = hashlib.blake2b(code_bytes, digest_size=16).digest()
+        with self._tree_cache_lock:
+            cached = self._tree_cache.get(file_path)
+            if cached is not None and cached[0] == digest:
+                self._tree_cache.move_to_end(file_path)
+                return cached[2]
+            if cached is not None:
+                # The old tree is edited in place below; take it out of the cache first.
+                del self._tree_cache[file_path]
+
+        if cached is None:
+            tree = self.parser.parse(code_bytes)
+        else:
+            old_bytes, old_tree = cached[1], cached[2]
+            _apply_edit(old_tree, old_bytes, code_bytes)
+            tree = self.parser.parse(code_bytes, old_tree)
+
+        with self._tree_cache_lock:
+            self._tree_cache[file_path] = (digest, code_bytes, tree)
+            self._tree_cache.move_to_end(file_path)
+            while len(self._tree_cache) > self.TREE_CACHE_SIZE:
+                self._tree_cache.popitem(last=False)
+        return tree
 
     def parse_java_file(self, java_code: str, *, file_path: Optional[str] = None) -> List[JavaMethod]:
         """Parse a single Java source file and extract methods/constructors.
@@ -55,35 +276,38 @@ class JavaParser:
             A list of parsed Java methods/constructors.
         """
 
-        tree = self.parser.parse(bytes(java_code, "utf8"))
-        methods: List[JavaMethod] = []
-
-        query = self.java_language.query(
-            """
-            (method_declaration) @method
-            (constructor_declaration) @constructor
-        """
-        )
+        if not java_code or java_code.isspace():
+            return []
+        if len(java_code) > self.MAX_SOURCE_CHARS:
+            logger.warning(
+                "Skipping oversized Java source %s (%d chars > %d)",
+                file_path or "<memory>",
+                len(java_code),
+                self.MAX_SOURCE_CHARS,
+            )
+            return []
 
-        captures = query.captures(tree.root_node)
+        # Convert to bytes once: the parser and every helper work on byte offsets.
+        code_bytes = java_code.encode("utf-8")
+        tree = self._parse_tree(code_bytes, file_path)
+        # Slicing a memoryview is zero-copy; text is decoded only for slices we keep.
+        code_view = memoryview(code_bytes)
+        methods: List[JavaMethod] = []
 
-        # Convert to bytes once for all subsequent operations
-        code_bytes = bytes(java_code, "utf8")
-        package_name = self._extract_package_name(tree.root_node, code_bytes)
+        package_name, declarations, calls_by_declaration = self._scan_file(tree.root_node, code_view)
 
-        for node, capture_name in captures:
-            method_type = "method" if capture_name == "method" else "constructor"
+        for (node, capture_name), calls in zip(declarations, calls_by_declaration):
+            method_type = _DECLARATION_KINDS[capture_name]
             
-            signature = self._extract_signature(node, code_bytes)
-            code = code_bytes[node.start_byte : node.end_byte].decode("utf8")
-            calls = self._extract_calls(node, code_bytes)
-            javadoc = self._extract_javadoc(node, code_bytes)
+            signature = self._extract_signature(node, code_view)
+            code = str(code_view[node.start_byte : node.end_byte], "utf8")
+            javadoc = self._extract_javadoc(node, code_view)
 
             # tree-sitter exposes 0-based (row, column) points.
-            start_line = int(getattr(node, "start_point", (0, 0))[0]) + 1
-            end_line = int(getattr(node, "end_point", (0, 0))[0]) + 1
+            start_line = node.start_point[0] + 1
+            end_line = node.end_point[0] + 1
 
-            enclosing_type = self._extract_enclosing_type_name(node, code_bytes)
+            enclosing_type = self._extract_enclosing_type_name(node, code_view)
             method_id = self._generate_id(
                 signature,
                 package_name=package_name,
@@ -108,16 +332,12 @@ class JavaParser:
 
         return methods
 
-    def _extract_signature(self, node, code: bytes) -> str:
+    def _extract_signature(self, node, code: memoryview) -> str:
         signature_parts: List[str] = []
 
         for child in node.children:
-            if child.type in ["modifiers", "type_identifier", "void_type", "generic_type"]:
-                signature_parts.append(code[child.start_byte : child.end_byte].decode("utf8"))
-            elif child.type == "identifier":
-                signature_parts.append(code[child.start_byte : child.end_byte].decode("utf8"))
-            elif child.type == "formal_parameters":
-                signature_parts.append(code[child.start_byte : child.end_byte].decode("utf8"))
+            if child.type in _SIGNATURE_CHILD_TYPES:
+                signature_parts.append(str(code[child.start_byte : child.end_byte], "utf8"))
 
         return " ".join(signature_parts).strip()
 
@@ -165,49 +385,63 @@ class JavaParser:
         if file_path:
             parts.append(str(file_path))
 
-        raw = "::".join([p for p in parts if p])
-        cleaned = re.sub(r"\s+", "_", raw)
-        cleaned = re.sub(r"[^\w_:\-./]", "", cleaned)
-        cleaned = cleaned.replace("/", "_")
-        cleaned = cleaned.replace(".", "_")
-        cleaned = cleaned.replace(":", "_")
-        cleaned = cleaned.replace("-", "_")
-        cleaned = re.sub(r"_+", "_", cleaned).strip("_")
-        return cleaned.lower()
+        return _normalize_id("::".join([p for p in parts if p]))
+
+    def _scan_file(
+        self, root_node, code: memoryview
+    ) -> Tuple[Optional[str], List[Tuple[Any, str]], List[List[str]]]:
+        """Collect package, declarations and call names in a single query pass.
 
-    def _extract_package_name(self, root_node, code: bytes) -> Optional[str]:
-        """Extract the package name for a compilation unit, if present.
+        A call belongs to every declaration whose byte range contains it, so calls made
+        inside nested/anonymous classes are also attributed to the outer method (as a
+        per-declaration sub-query would).
 
         Args:
             root_node: Tree-sitter root node.
-            code: Full Java source bytes.
+            code: View over the full Java source bytes.
 
         Returns:
-            Package name like "com.example" or None if absent.
+            (package_name, declarations, calls_by_declaration) where declarations are
+            (node, capture_name) pairs in document order and calls_by_declaration[i]
+            holds the sorted unique call names found inside declarations[i].
         """
 
-        try:
-            query = self.java_language.query(
-                """
-                (package_declaration
-                    (scoped_identifier) @pkg)
-                """
-            )
-            captures = query.captures(root_node)
-            for node, _ in captures:
-                name = code[node.start_byte : node.end_byte].decode("utf8").strip()
-                if name:
-                    return name
-        except Exception:
-            return None
-        return None
-
-    def _extract_enclosing_type_name(self, node, code: bytes) -> Optional[str]:
+        package_name: Optional[str] = None
+        declarations: List[Tuple[Any, str]] = []
+        call_sites: List[Tuple[int, str]] = []
+
+        for node, capture_name in self._query(_FILE_QUERY).captures(root_node):
+            if capture_name == "call_name":
+                # Call names repeat heavily across a codebase; interning keeps one string
+                # per name, shared by every JavaMethod.calls list that contains it.
+                call_sites.append((node.start_byte, sys.intern(str(code[node.start_byte : node.end_byte], "utf8"))))
+            elif capture_name == "pkg":
+                if package_name is None:
+                    package_name = str(code[node.start_byte : node.end_byte], "utf8").strip() or None
+            else:
+                declarations.append((node, capture_name))
+
+        declarations.sort(key=lambda d: d[0].start_byte)
+        call_sites.sort(key=lambda c: c[0])
+        offsets = [offset for offset, _ in call_sites]
+        names = [name for _, name in call_sites]
+
+        # Each declaration's calls are a contiguous run of the offset-sorted call sites.
+        calls_by_declaration: List[List[str]] = []
+        for node, _ in declarations:
+            lo = bisect_left(offsets, node.start_byte)
+            hi = bisect_left(offsets, node.end_byte, lo)
+            # Sorted so a method's calls (and any text built from them) are stable across runs.
+            calls_by_declaration.append(sorted(set(names[lo:hi])))
+
+        return package_name, declarations, calls_by_declaration
+
+    def _extract_enclosing_type_name(self, node, code: memoryview) -> Optional[str]:
         """Find the closest enclosing type name (class/interface/enum/record).
 
         Args:
             node: Tree-sitter node for a method/constructor declaration.
-            code: Full Java source bytes.
+            code: View over the full Java source bytes.
 
         Returns:
             Enclosing type name (e.g., "MyService") or None.
@@ -215,65 +449,34 @@ class JavaParser:
 
         current = getattr(node, "parent", None)
         while current is not None:
-            if current.type in {
-                "class_declaration",
-                "interface_declaration",
-                "enum_declaration",
-                "record_declaration",
-                "annotation_type_declaration",
-            }:
+            if current.type in _TYPE_DECLARATION_NODES:
                 # Most declarations include the simple name as an `identifier` child.
                 for child in getattr(current, "children", []) or []:
                     if child.type == "identifier":
-                        name = code[child.start_byte : child.end_byte].decode("utf8").strip()
+                        name = str(code[child.start_byte : child.end_byte], "utf8").strip()
                         return name or None
             current = getattr(current, "parent", None)
         return None
 
-    def _extract_calls(self, node, code: bytes) -> List[str]:
-        calls: List[str] = []
-
-        query = self.java_language.query(
-            """
-            (method_invocation
-                name: (identifier) @call_name)
-        """
-        )
-
-        captures = query.captures(node)
-
-        for call_node, _ in captures:
-            call_name = code[call_node.start_byte : call_node.end_byte].decode("utf8")
-            calls.append(call_name)
-
-        return list(set(calls))
-
-    def _extract_javadoc(self, node, code: bytes) -> Optional[str]:
-        parent = node.parent
-        if not parent:
+    def _extract_javadoc(self, node, code: memoryview) -> Optional[str]:
+        # Javadoc comments are `extra` nodes placed right before the declaration.
+        # Older tree-sitter-java grammars name them "comment" instead of "block_comment".
+        prev_sibling = node.prev_sibling
+        if prev_sibling is not None:
+            start = prev_sibling.start_byte
+            # Check the opening bytes before decoding; plain block comments are skipped.
+            if prev_sibling.type in ("block_comment", "comment") and code[start : start + 3] == b"/**":
+                return str(code[start : prev_sibling.end_byte], "utf8")
             return None
 
-        node_index = None
-        for i, child in enumerate(parent.children):
-            if (
-                child.type == node.type
-                and child.start_byte == node.start_byte
-                and child.end_byte == node.end_byte
-            ):
-                node_index = i
-                break
-
-        if node_index is not None and node_index > 0:
-            prev_sibling = parent.children[node_index - 1]
-            if prev_sibling.type == "block_comment":
-                comment_text = code[prev_sibling.start_byte : prev_sibling.end_byte].decode("utf8")
-                if comment_text.startswith("/**"):
-                    return comment_text
-
+        # No sibling to inspect (e.g. unusual tree shapes): fall back to a text scan.
         lookback_start = max(0, node.start_byte - 4000)
-        prefix = code[lookback_start : node.start_byte].decode("utf8", errors="ignore")
-        match = re.search(r"(/\*\*[\s\S]*?\*/)[\s]*\Z", prefix)
+        prefix = bytes(code[lookback_start : node.start_byte])
+        # Cheap substring check first: most declarations have no Javadoc at all.
+        if b"/**" not in prefix:
+            return None
+        match = _JAVADOC_TAIL_RE.search(prefix)
         if match:
-            return match.group(1)
+            return match.group(1).decode("utf8", errors="ignore")
 
         return None
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import hashlib
+import pickle
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from core.parsing.java_parser import JavaMethod
+
+# Bump when JavaParser output changes so stale cached results are ignored.
+PARSE_CACHE_VERSION = 1
+
+
+class SqliteParseCache:
+    """SQLite-backed cache of parsed Java methods, keyed by file path + content hash.
+
+    tree-sitter trees are not serializable, so the cache stores the parser output
+    (the list of `JavaMethod` for a file). Re-scanning an unchanged file becomes a
+    single lookup instead of a parse.
+
+    One connection is shared by all threads of a scan; writes are committed in
+    `commit()`/`close()` rather than per file.
+    """
+
+    def __init__(self, *, sqlite_path: str):
+        self._path = str(Path(sqlite_path).expanduser().resolve())
+        Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(self._path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS parse_cache (
+                file_path TEXT NOT NULL PRIMARY KEY,
+                sha256 BLOB NOT NULL,
+                version INTEGER NOT NULL,
+                blob BLOB NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def content_hash(java_code: str) -> bytes:
+        """Return the SHA-256 digest used to key `java_code`."""
+
+        return hashlib.sha256(java_code.encode("utf-8")).digest()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            raise ValueError("SqliteParseCache is closed")
+        return self._conn
+
+    def get(self, file_path: str, digest: bytes) -> Optional[List[JavaMethod]]:
+        """Return cached methods for `file_path` if its content hash still matches.
+
+        Args:
+            file_path: Source file path (as passed to the parser).
+            digest: `content_hash()` of the current file content.
+
+        Returns:
+            The cached methods, or None on a miss.
+        """
+
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT blob FROM parse_cache WHERE file_path = ? AND sha256 = ? AND version = ?",
+                (file_path, digest, PARSE_CACHE_VERSION),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return pickle.loads(row[0])
+        except Exception:
+            return None
+
+    def put(self, file_path: str, digest: bytes, methods: Sequence[JavaMethod]) -> None:
+        """Store the parse result for `file_path` at content hash `digest`."""
+
+        blob = pickle.dumps(list(methods), protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO parse_cache(file_path, sha256, version, blob) VALUES (?, ?, ?, ?)",
+                (file_path, digest, PARSE_CACHE_VERSION, blob),
+            )
+
+    def commit(self) -> None:
+        """Persist pending writes."""
+
+        with self._lock:
+            self._connection().commit()
+
+    def close(self) -> None:
+        """Commit pending writes and close the connection. Safe to call more than once."""
+
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> "SqliteParseCache":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
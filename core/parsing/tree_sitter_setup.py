@@ -21,6 +21,9 @@ def setup_java_language() -> None:
             [
                 "git",
                 "clone",
+                # Only the grammar sources at the tip are needed to build the library.
+                "--depth",
+                "1",
                 "https://github.com/tree-sitter/tree-sitter-java",
                 "vendor/tree-sitter-java",
             ],
@@ -29,5 +32,6 @@ def setup_java_language() -> None:
             timeout=60,
         )
 
-    if not os.path.exists("build/java-languages.so"):
-        Language.build_library("build/java-languages.so", ["vendor/tree-sitter-java"])
+    # build_library itself skips the compile when the library is newer than the
+    # grammar sources, so it is always called: an updated checkout gets rebuilt.
+    Language.build_library("build/java-languages.so", ["vendor/tree-sitter-java"])
@@ -1,14 +1,137 @@
 from __future__ import annotations
 
+import itertools
+import re
 import sqlite3
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
 from core.parsing.java_parser import JavaMethod
 
+_T = TypeVar("_T")
+
+# Identifier-like tokens of a lowercased signature (method name, types, parameter names).
+_SIGNATURE_TOKEN_RE = re.compile(r"[a-z_$][a-z0-9_$]*")
+
+# Call edges around a start node, found with a single recursive query.
+# `reach` walks call edges in both directions (like the original Python BFS) up to the
+# requested depth; its recursive step is `{reach_step}` (see below). The trailing
+# ORDER BY turns the recursion queue into a breadth-first one and the LIMIT caps the
+# total number of expanded rows, so work stays bounded on dense graphs. `expanded`
+# keeps each node at its shallowest depth.
+# The outgoing ('out') and incoming ('in') edges of the expanded nodes come back in one
+# result set, told apart by `direction`, together with a 'node' row for the start node;
+# `reach` is evaluated once for both and node labels are joined in the same query.
+# `{project}` is the project filter on `e`, `{src_project}`/`{dst_project}` the ones on
+# the label joins (see `_project_clause`).
+# Parameters: start node, reach step params, node budget,
+# (project params, limit) x2, start node, src label project params,
+# dst label project params.
+_NEIGHBOR_EDGES_SQL = """
+WITH RECURSIVE
+    reach(node, depth) AS (
+        SELECT ?, 0
+        UNION
+{reach_step}
+        ORDER BY 2
+        LIMIT ?
+    ),
+    expanded(node, depth) AS (
+        SELECT node, MIN(depth) FROM reach GROUP BY node
+    )
+SELECT d.direction, d.src, d.dst, ns.label, nd.label
+FROM (
+    SELECT * FROM (
+        SELECT 'out' AS direction, x.depth AS depth, e.src AS src, e.dst AS dst
+        FROM expanded x
+        JOIN edges e ON e.src = x.node
+        WHERE {project} AND e.type = 'calls'
+        ORDER BY x.depth, e.src, e.dst
+        LIMIT ?
+    )
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'in' AS direction, x.depth AS depth, e.src AS src, e.dst AS dst
+        FROM expanded x
+        JOIN edges e ON e.dst = x.node
+        WHERE {project} AND e.type = 'calls'
+        ORDER BY x.depth, e.src, e.dst
+        LIMIT ?
+    )
+    UNION ALL
+    SELECT 'node', 0, ?, NULL
+) d
+LEFT JOIN nodes ns ON ns.node_id = d.src AND {src_project}
+LEFT JOIN nodes nd ON nd.node_id = d.dst AND {dst_project}
+ORDER BY d.depth, d.src, d.dst
+"""
+
+# Recursive step of `reach`. Outgoing and incoming edges as two recursive SELECTs make
+# each one an index seek, but SQLite only accepts several recursive SELECTs from 3.34.
+# Parameters: (depth, project params) x2.
+_REACH_STEP_SPLIT = """
+        SELECT e.dst, r.depth + 1
+        FROM reach r
+        JOIN edges e ON e.src = r.node
+        WHERE r.depth + 1 < ? AND {project} AND e.type = 'calls'
+        UNION
+        SELECT e.src, r.depth + 1
+        FROM reach r
+        JOIN edges e ON e.dst = r.node
+        WHERE r.depth + 1 < ? AND {project} AND e.type = 'calls'"""
+
+# Fallback for older SQLite: one recursive SELECT over an undirected view of the edges.
+# The view is materialized per step, so it is slower on large graphs but equivalent.
+# Parameters: project params x2, depth.
+_REACH_STEP_UNDIRECTED = """
+        SELECT u.b, r.depth + 1
+        FROM reach r
+        JOIN (
+            SELECT e.src AS a, e.dst AS b FROM edges e WHERE {project} AND e.type = 'calls'
+            UNION ALL
+            SELECT e.dst, e.src FROM edges e WHERE {project} AND e.type = 'calls'
+        ) u ON u.a = r.node
+        WHERE r.depth + 1 < ?"""
+
+# Rows per multi-row INSERT statement in rebuild(); 500 rows of up to six columns
+# stays well below SQLite's bound-parameter limit.
+_INSERT_BATCH_SIZE = 500
+
+
+def _batched(rows: Iterable[_T], size: int) -> Iterator[List[_T]]:
+    it = iter(rows)
+    while batch := list(itertools.islice(it, size)):
+        yield batch
+
+
+def _bulk_insert(
+    conn: sqlite3.Connection,
+    insert_sql: str,
+    rows: Iterable[Tuple[Optional[str], ...]],
+    chunk: int = _INSERT_BATCH_SIZE,
+) -> None:
+    """Insert `rows` using one multi-row `VALUES (...), (...)` statement per chunk.
+
+    Args:
+        conn: Open connection (inside a transaction).
+        insert_sql: Statement prefix up to and including `VALUES`.
+        rows: Row tuples, all of the same width.
+        chunk: Maximum rows per statement.
+    """
+
+    for batch in _batched(rows, chunk):
+        placeholders = "(" + ", ".join("?" * len(batch[0])) + ")"
+        conn.execute(
+            f"{insert_sql} " + ", ".join([placeholders] * len(batch)),
+            tuple(itertools.chain.from_iterable(batch)),
+        )
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class GraphStats:
     project: Optional[str]
     files: int
@@ -30,21 +153,82 @@ class SqliteProjectGraphStore:
 
     Notes:
     - `calls` in JavaMethod is only method names (identifiers). Resolving call edges is
-      best-effort by matching call names against method signatures (same heuristic as
-      GraphEnrichedRetriever).
+      best-effort by matching call names against the identifier tokens of method
+      signatures (an inverted index, so a call name must equal a whole token).
     """
 
     def __init__(self, *, sqlite_path: str):
         self._path = str(Path(sqlite_path).expanduser().resolve())
         Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+        # One connection per store, opened lazily and shared by all threads; `_lock`
+        # serializes its use (see `_cx`). Pragmas and SQL functions are applied once,
+        # on open. The lock is reentrant so helpers can take it again inside a block.
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        # overview_text() results keyed on (project, limit). Entries are stamped with
+        # the local write counter and SQLite's data_version, which changes when another
+        # connection commits, so writes from other stores or processes are noticed too.
+        self._version = 0
+        self._overview_cache: Dict[Tuple[str, int], Tuple[Tuple[int, int], str]] = {}
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode: reads run without an implicit transaction and writes are
+        # grouped explicitly (see `_write_transaction`).
+        conn = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        # Lets rebuild() derive file nodes and contains edges with INSERT ... SELECT.
+        conn.create_function("file_node_id", 2, self._file_node_id, deterministic=True)
+        return conn
+
+    @contextmanager
+    def _cx(self) -> Iterator[sqlite3.Connection]:
+        """Yield the store's shared connection under `_lock`, opening it on first use."""
+
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            yield self._conn
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Connection]:
+        """Hold the store lock and run the block in one BEGIN IMMEDIATE ... COMMIT."""
+
+        with self._cx() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the shared connection. The store reopens it if used again."""
+
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            # data_version is per connection; stamps from the old one mean nothing.
+            self._overview_cache.clear()
+
+    def __enter__(self) -> "SqliteProjectGraphStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
     def _init_db(self) -> None:
-        with sqlite3.connect(self._path) as conn:
+        with self._write_transaction() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS nodes (
-                    project TEXT NULL,
+                    project TEXT NOT NULL DEFAULT '',
                     node_id TEXT NOT NULL,
                     kind TEXT NOT NULL,
                     label TEXT NOT NULL,
@@ -57,7 +241,7 @@ class SqliteProjectGraphStore:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS edges (
-                    project TEXT NULL,
+                    project TEXT NOT NULL DEFAULT '',
                     src TEXT NOT NULL,
                     dst TEXT NOT NULL,
                     type TEXT NOT NULL,
@@ -65,8 +249,38 @@ class SqliteProjectGraphStore:
                 )
                 """
             )
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_edges_src ON edges(project, src)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_edges_dst ON edges(project, dst)")
+            # Covering indexes for the edge lookups (filtered by project + type): the
+            # queries below are answered from the index without reading the table.
+            conn.execute("DROP INDEX IF EXISTS idx_edges_src")
+            conn.execute("DROP INDEX IF EXISTS idx_edges_dst")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_edges_ptsd ON edges(project, type, src, dst)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_edges_ptds ON edges(project, type, dst, src)")
+            # Lets the per-kind node counts in overview_text() run index-only.
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_nodes_kind ON nodes(project, kind)")
+
+            # Schema v1: the default scope is stored as '' instead of NULL, so every query
+            # filters on a plain `project = ?`. NULLs are distinct in the primary keys, so
+            # older databases may hold duplicate default-scope rows: keep one of each.
+            (user_version,) = conn.execute("PRAGMA user_version").fetchone()
+            if user_version < 1:
+                conn.execute("UPDATE OR REPLACE nodes SET project = '' WHERE project IS NULL")
+                conn.execute("UPDATE OR REPLACE edges SET project = '' WHERE project IS NULL")
+                conn.execute("PRAGMA user_version = 1")
+
+    @staticmethod
+    def _project_key(project: Optional[str]) -> str:
+        """Stored value of the `project` column (the default scope is '')."""
+
+        return project or ""
+
+    @classmethod
+    def _project_clause(cls, project: Optional[str], column: str = "project") -> Tuple[str, Tuple[str, ...]]:
+        """SQL filter (and its parameters) selecting rows of `project`.
+
+        A single equality lets SQLite seek on the `project` index prefix.
+        """
+
+        return f"{column} = ?", (cls._project_key(project),)
 
     @staticmethod
     def _scoped_id(project: Optional[str], method_id: str) -> str:
@@ -76,128 +290,169 @@ class SqliteProjectGraphStore:
     def _file_node_id(project: Optional[str], file_path: str) -> str:
         return f"{project}::file::{file_path}" if project else f"file::{file_path}"
 
-    def rebuild(self, *, project: Optional[str], methods: Sequence[JavaMethod]) -> GraphStats:
-        """Rebuild graph for a project scope from a set of parsed methods."""
+    def rebuild(self, *, project: Optional[str], methods: Iterable[JavaMethod]) -> GraphStats:
+        """Rebuild graph for a project scope from parsed methods.
 
-        project_key = project
+        `methods` is consumed in a single pass, so it may be a generator.
+        """
 
-        # Clear existing.
-        with sqlite3.connect(self._path) as conn:
-            conn.execute("DELETE FROM edges WHERE project IS ? OR project = ?", (project_key, project_key))
-            conn.execute("DELETE FROM nodes WHERE project IS ? OR project = ?", (project_key, project_key))
+        project_key = self._project_key(project)
 
-        method_nodes: List[Tuple[Optional[str], str, str, str, Optional[str], Optional[str]]] = []
-        file_nodes: Dict[str, Tuple[Optional[str], str, str, str, str, Optional[str]]] = {}
+        method_nodes: List[Tuple[str, str, str, str, Optional[str], Optional[str]]] = []
+        file_paths_seen: Set[str] = set()
 
-        contains_edges: List[Tuple[Optional[str], str, str, str]] = []
-        call_edges: List[Tuple[Optional[str], str, str, str]] = []
+        # A set deduplicates call edges as they are produced.
+        call_edges: Set[Tuple[str, str, str, str]] = set()
 
-        # Precompute signature match index.
-        method_index: List[Tuple[str, str]] = []  # (node_id, signature_lower)
+        # Phase 1 (single pass): method nodes, the inverted index
+        # (signature token -> method node ids) and normalized call names grouped by
+        # token, so each distinct call name is resolved once in phase 2.
+        token_to_nodes: Dict[str, List[str]] = defaultdict(list)
+        callers_by_token: Dict[str, List[str]] = defaultdict(list)
 
-        for m in methods:
-            fp = getattr(m, "file_path", None) or "(unknown)"
-            node_id = self._scoped_id(project_key, m.id)
-            label = m.signature or m.id
-
-            method_nodes.append((project_key, node_id, "method", label, fp, m.signature))
-            method_index.append((node_id, (m.signature or "").lower()))
-
-            file_node_id = self._file_node_id(project_key, fp)
-            if file_node_id not in file_nodes:
-                file_nodes[file_node_id] = (project_key, file_node_id, "file", fp, fp, None)
+        # Local bindings for the hot loop below.
+        _lower, _strip, _findall = str.lower, str.strip, _SIGNATURE_TOKEN_RE.findall
+        scoped_id = self._scoped_id
+        add_file, add_node = file_paths_seen.add, method_nodes.append
 
-            contains_edges.append((project_key, file_node_id, node_id, "contains"))
-
-        # Build call edges (best-effort).
         for m in methods:
-            src = self._scoped_id(project_key, m.id)
-            calls = list(getattr(m, "calls", None) or [])
-            for call_name in calls:
-                cn = str(call_name).strip().lower()
-                if not cn:
-                    continue
-                for dst, sig_lower in method_index:
-                    if cn in sig_lower:
-                        if dst != src:
-                            call_edges.append((project_key, src, dst, "calls"))
-
-        # Deduplicate in Python before insert.
-        call_edges = list(dict.fromkeys(call_edges))
-        contains_edges = list(dict.fromkeys(contains_edges))
-
-        with sqlite3.connect(self._path) as conn:
-            conn.executemany(
-                "INSERT OR REPLACE INTO nodes(project, node_id, kind, label, file_path, signature) VALUES (?, ?, ?, ?, ?, ?)",
-                list(file_nodes.values()) + method_nodes,
+            fp = m.file_path or "(unknown)"
+            add_file(fp)
+            node_id = scoped_id(project_key, m.id)
+            signature = m.signature
+            label = signature or m.id
+
+            add_node((project_key, node_id, "method", label, fp, signature))
+            if signature:
+                for token in set(_findall(_lower(signature))):
+                    token_to_nodes[token].append(node_id)
+
+            # Each distinct call name is recorded once per method, however often it is called.
+            calls = {_lower(_strip(c if isinstance(c, str) else str(c))) for c in m.calls or ()}
+            calls.discard("")
+            for cn in calls:
+                callers_by_token[cn].append(node_id)
+
+        # Phase 2: resolve call edges (best-effort) as a hash join on the call token.
+        for token in callers_by_token.keys() & token_to_nodes.keys():
+            dsts = token_to_nodes[token]
+            for src in callers_by_token[token]:
+                for dst in dsts:
+                    if dst != src:
+                        call_edges.add((project_key, src, dst, "calls"))
+
+        # Clear and repopulate the project in a single explicit transaction, inserting
+        # rows in bounded batches rather than from one materialized list. File nodes and
+        # file -> method contains edges are derived from the method rows inside SQLite.
+        clause, clause_params = self._project_clause(project_key)
+        with self._write_transaction() as conn:
+            conn.execute(f"DELETE FROM edges WHERE {clause}", clause_params)
+            conn.execute(f"DELETE FROM nodes WHERE {clause}", clause_params)
+            _bulk_insert(
+                conn,
+                "INSERT OR REPLACE INTO nodes(project, node_id, kind, label, file_path, signature) VALUES",
+                method_nodes,
             )
-            conn.executemany(
-                "INSERT OR REPLACE INTO edges(project, src, dst, type) VALUES (?, ?, ?, ?)",
-                contains_edges + call_edges,
+            conn.execute(
+                f"""
+                INSERT OR REPLACE INTO nodes(project, node_id, kind, label, file_path, signature)
+                SELECT project, file_node_id(project, file_path), 'file', file_path, file_path, NULL
+                FROM nodes
+                WHERE {clause} AND kind='method'
+                GROUP BY file_path
+                """,
+                clause_params,
             )
+            contains_count = conn.execute(
+                f"""
+                INSERT OR IGNORE INTO edges(project, src, dst, type)
+                SELECT project, file_node_id(project, file_path), node_id, 'contains'
+                FROM nodes
+                WHERE {clause} AND kind='method'
+                """,
+                clause_params,
+            ).rowcount
+            _bulk_insert(conn, "INSERT OR IGNORE INTO edges(project, src, dst, type) VALUES", call_edges)
+            self._version += 1
+            self._overview_cache.clear()
 
-        file_count = len({getattr(m, "file_path", None) or "(unknown)" for m in methods})
         return GraphStats(
-            project=project_key,
-            files=file_count,
+            project=project,
+            files=len(file_paths_seen),
             methods=len(method_nodes),
             call_edges=len(call_edges),
-            contains_edges=len(contains_edges),
+            contains_edges=contains_count,
         )
 
     def overview_text(self, *, project: Optional[str], limit: int = 25) -> str:
-        """Return a compact project overview from stored nodes/edges."""
-
+        """Return a compact project overview from stored nodes/edges.
+
+        Results are cached until the graph is written again.
+        """
+
+        key = (self._project_key(project), int(limit))
+        with self._cx() as conn:
+            (data_version,) = conn.execute("PRAGMA data_version").fetchone()
+            stamp = (self._version, int(data_version))
+            cached = self._overview_cache.get(key)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+            text = self._build_overview_text(project=project, limit=limit)
+            self._overview_cache[key] = (stamp, text)
+        return text
+
+    def _build_overview_text(self, *, project: Optional[str], limit: int) -> str:
         project_key = project
+        clause, clause_params = self._project_clause(project_key)
 
-        with sqlite3.connect(self._path) as conn:
-            method_count = conn.execute(
-                "SELECT COUNT(*) FROM nodes WHERE (project IS ? OR project = ?) AND kind='method'",
-                (project_key, project_key),
-            ).fetchone()[0]
-            file_count = conn.execute(
-                "SELECT COUNT(*) FROM nodes WHERE (project IS ? OR project = ?) AND kind='file'",
-                (project_key, project_key),
-            ).fetchone()[0]
-            call_edges = conn.execute(
-                "SELECT COUNT(*) FROM edges WHERE (project IS ? OR project = ?) AND type='calls'",
-                (project_key, project_key),
-            ).fetchone()[0]
-
-            top_callers = conn.execute(
-                """
-                SELECT src, COUNT(*) AS c
-                FROM edges
-                WHERE (project IS ? OR project = ?) AND type='calls'
-                GROUP BY src
-                ORDER BY c DESC
-                LIMIT ?
+        with self._cx() as conn:
+            method_count, file_count, call_edges = conn.execute(
+                f"""
+                SELECT
+                    (SELECT COUNT(*) FROM nodes WHERE {clause} AND kind='method'),
+                    (SELECT COUNT(*) FROM nodes WHERE {clause} AND kind='file'),
+                    (SELECT COUNT(*) FROM edges WHERE {clause} AND type='calls')
                 """,
-                (project_key, project_key, int(max(1, limit))),
-            ).fetchall()
+                clause_params * 3,
+            ).fetchone()
 
-            top_callees = conn.execute(
-                """
-                SELECT dst, COUNT(*) AS c
-                FROM edges
-                WHERE (project IS ? OR project = ?) AND type='calls'
-                GROUP BY dst
-                ORDER BY c DESC
-                LIMIT ?
+            # Top callers, top callees and sample edges in one round-trip; `part`
+            # tells the three result sets apart.
+            lim = int(max(1, limit))
+            rows = conn.execute(
+                f"""
+                SELECT * FROM (
+                    SELECT 'caller' AS part, src AS a, NULL AS b, COUNT(*) AS c
+                    FROM edges
+                    WHERE {clause} AND type='calls'
+                    GROUP BY src
+                    ORDER BY c DESC
+                    LIMIT ?
+                )
+                UNION ALL
+                SELECT * FROM (
+                    SELECT 'callee' AS part, dst AS a, NULL AS b, COUNT(*) AS c
+                    FROM edges
+                    WHERE {clause} AND type='calls'
+                    GROUP BY dst
+                    ORDER BY c DESC
+                    LIMIT ?
+                )
+                UNION ALL
+                SELECT * FROM (
+                    SELECT 'edge' AS part, src AS a, dst AS b, 0 AS c
+                    FROM edges
+                    WHERE {clause} AND type='calls'
+                    ORDER BY src, dst
+                    LIMIT ?
+                )
                 """,
-                (project_key, project_key, int(max(1, limit))),
+                (*clause_params, lim) * 3,
             ).fetchall()
 
-            sample_edges = conn.execute(
-                """
-                SELECT src, dst
-                FROM edges
-                WHERE (project IS ? OR project = ?) AND type='calls'
-                ORDER BY src, dst
-                LIMIT ?
-                """,
-                (project_key, project_key, int(max(1, limit))),
-            ).fetchall()
+            top_callers = [(a, c) for part, a, _, c in rows if part == "caller"]
+            top_callees = [(a, c) for part, a, _, c in rows if part == "callee"]
+            sample_edges = [(a, b) for part, a, b, _ in rows if part == "edge"]
 
             labels = self._labels_for_nodes(conn, project_key, [r[0] for r in top_callers + top_callees])
 
@@ -241,48 +496,46 @@ class SqliteProjectGraphStore:
         d = max(1, min(int(depth), 4))
         lim = max(1, min(int(limit), 200))
 
-        frontier = {node}
-        visited = {node}
+        clause, clause_params = self._project_clause(project_key, "e.project")
+        src_clause, src_params = self._project_clause(project_key, "ns.project")
+        dst_clause, dst_params = self._project_clause(project_key, "nd.project")
+        if sqlite3.sqlite_version_info >= (3, 34):
+            reach_step, reach_params = _REACH_STEP_SPLIT, (d, *clause_params, d, *clause_params)
+        else:
+            reach_step, reach_params = _REACH_STEP_UNDIRECTED, (*clause_params, *clause_params, d)
+        sql = _NEIGHBOR_EDGES_SQL.format(
+            reach_step=reach_step.strip("\n").format(project=clause),
+            project=clause,
+            src_project=src_clause,
+            dst_project=dst_clause,
+        )
+        # At most `lim` nodes per level, as the per-level frontier cap did before.
+        budget = lim * d
+        params = (
+            node,
+            *reach_params,
+            budget,
+            *clause_params, lim,
+            *clause_params, lim,
+            node,
+            *src_params,
+            *dst_params,
+        )
+
         edges_out: List[Tuple[str, str]] = []
         edges_in: List[Tuple[str, str]] = []
-
-        with sqlite3.connect(self._path) as conn:
-            for _ in range(d):
-                if not frontier:
-                    break
-                next_frontier = set()
-                for n in list(frontier)[:lim]:
-                    out_rows = conn.execute(
-                        """
-                        SELECT dst FROM edges
-                        WHERE (project IS ? OR project = ?) AND type='calls' AND src = ?
-                        LIMIT ?
-                        """,
-                        (project_key, project_key, n, lim),
-                    ).fetchall()
-                    for (dst,) in out_rows:
-                        edges_out.append((n, dst))
-                        if dst not in visited:
-                            visited.add(dst)
-                            next_frontier.add(dst)
-
-                    in_rows = conn.execute(
-                        """
-                        SELECT src FROM edges
-                        WHERE (project IS ? OR project = ?) AND type='calls' AND dst = ?
-                        LIMIT ?
-                        """,
-                        (project_key, project_key, n, lim),
-                    ).fetchall()
-                    for (src,) in in_rows:
-                        edges_in.append((src, n))
-                        if src not in visited:
-                            visited.add(src)
-                            next_frontier.add(src)
-
-                frontier = next_frontier
-
-            labels = self._labels_for_nodes(conn, project_key, list(visited))
+        labels: Dict[str, str] = {}
+        with self._cx() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        for direction, src, dst, src_label, dst_label in rows:
+            if src_label is not None:
+                labels[str(src)] = str(src_label)
+            if direction == "node":
+                continue
+            if dst_label is not None:
+                labels[str(dst)] = str(dst_label)
+            (edges_out if direction == "out" else edges_in).append((str(src), str(dst)))
 
         header = labels.get(node, node)
         lines = [f"Node: {header}", f"Depth: {d}"]
@@ -305,24 +558,25 @@ class SqliteProjectGraphStore:
         project: Optional[str],
         node_ids: Iterable[str],
     ) -> Dict[str, str]:
-        ids = list(dict.fromkeys([str(n) for n in node_ids if n]))
+        ids = {str(n) for n in node_ids if n}
         if not ids:
             return {}
 
-        # Chunk to avoid SQLite parameter limits.
-        out: Dict[str, str] = {}
-        chunk_size = 500
-        for i in range(0, len(ids), chunk_size):
-            chunk = ids[i : i + chunk_size]
-            qmarks = ",".join(["?"] * len(chunk))
-            rows = conn.execute(
-                f"""
-                SELECT node_id, label
-                FROM nodes
-                WHERE (project IS ? OR project = ?) AND node_id IN ({qmarks})
-                """,
-                (project, project, *chunk),
-            ).fetchall()
-            for node_id, label in rows:
-                out[str(node_id)] = str(label)
-        return out
+        # Stage the ids in a per-connection temp table and join once, instead of one
+        # `IN (...)` query (re-parsed and re-planned) per 500-id chunk. CROSS JOIN keeps
+        # the id list as the outer loop so each id is a primary-key seek into `nodes`.
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS _label_ids(id TEXT PRIMARY KEY)")
+        conn.execute("DELETE FROM _label_ids")
+        conn.executemany("INSERT INTO _label_ids(id) VALUES (?)", ((i,) for i in ids))
+
+        clause, clause_params = self._project_clause(project, "n.project")
+        rows = conn.execute(
+            f"""
+            SELECT n.node_id, n.label
+            FROM _label_ids i
+            CROSS JOIN nodes n
+            WHERE n.node_id = i.id AND {clause}
+            """,
+            clause_params,
+        )
+        return {str(node_id): str(label) for node_id, label in rows}
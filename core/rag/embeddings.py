@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import os
 from typing import Any, Dict, Optional
 
@@ -27,7 +29,12 @@ def _env_int(name: str) -> Optional[int]:
         ValueError: If the variable is set but not a valid integer.
     """
 
-    raw = os.getenv(name)
+    return _parse_env_int(name, os.getenv(name))
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_env_int(name: str, raw: Optional[str]) -> Optional[int]:
+    # Keyed on the raw value so runtime changes to the environment still apply.
     if raw is None or not str(raw).strip():
         return None
     try:
@@ -36,6 +43,37 @@ def _env_int(name: str) -> Optional[int]:
         raise ValueError(f"Invalid integer for {name}: {raw!r}") from e
 
 
+@functools.lru_cache(maxsize=16)
+def _get_encoder(name: Optional[str], model: str) -> Any:
+    """Return a tiktoken encoder, constructed once per (name, model) pair.
+
+    Args:
+        name: Optional explicit tiktoken encoding name.
+        model: Embeddings model name used for encoding inference.
+
+    Returns:
+        A tiktoken Encoding instance.
+
+    Raises:
+        RuntimeError: If tiktoken is not installed.
+    """
+
+    try:
+        import tiktoken  # type: ignore
+    except Exception as e:
+        raise RuntimeError(
+            "Embedding token limit is enabled but 'tiktoken' is not installed. "
+            "Install it (pip install tiktoken) or disable embeddings_max_input_tokens."
+        ) from e
+
+    if name:
+        return tiktoken.get_encoding(name)
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        return tiktoken.get_encoding("cl100k_base")
+
+
 def _truncate_texts_for_embeddings(
     texts: list[str],
     *,
@@ -64,38 +102,28 @@ def _truncate_texts_for_embeddings(
     if max_input_tokens <= 0:
         raise ValueError("max_input_tokens must be a positive integer")
 
-    try:
-        import tiktoken  # type: ignore
-    except Exception as e:
-        raise RuntimeError(
-            "Embedding token limit is enabled but 'tiktoken' is not installed. "
-            "Install it (pip install tiktoken) or disable embeddings_max_input_tokens."
-        ) from e
+    enc = _get_encoder(token_encoding_name or None, model)
 
-    if token_encoding_name:
-        enc = tiktoken.get_encoding(token_encoding_name)
-    else:
-        try:
-            enc = tiktoken.encoding_for_model(model)
-        except Exception:
-            enc = tiktoken.get_encoding("cl100k_base")
-
-    out: list[str] = []
-    for text in texts:
-        if text is None:
-            out.append("")
-            continue
-
-        # Fast path: empty/short strings.
-        raw = str(text)
-        tokens = enc.encode(raw)
-        if len(tokens) <= max_input_tokens:
-            out.append(raw)
-            continue
+    out = [str(text) if text is not None else "" for text in texts]
 
-        truncated = enc.decode(tokens[:max_input_tokens])
-        out.append(truncated)
+    # Fast path: every token covers at least one UTF-8 byte, so strings with
+    # no more bytes than the limit cannot exceed it and skip tokenization.
+    pending = [
+        i
+        for i, raw in enumerate(out)
+        if len(raw) * 4 > max_input_tokens
+        and not (len(raw) <= max_input_tokens and raw.isascii())
+    ]
+    if not pending:
+        return out
 
+    # encode_batch releases the GIL and tokenizes across threads.
+    token_lists = enc.encode_batch(
+        [out[i] for i in pending], num_threads=max(1, os.cpu_count() or 1)
+    )
+    for i, tokens in zip(pending, token_lists):
+        if len(tokens) > max_input_tokens:
+            out[i] = enc.decode(tokens[:max_input_tokens])
     return out
 
 
@@ -132,7 +160,11 @@ class TokenLimitedOpenAIEmbeddings(OpenAIEmbeddings):
 
 
 def create_embeddings(base_url: Optional[str] = None) -> OpenAIEmbeddings:
-    """Create OpenAI embeddings with optional custom base URL."""
+    """Create OpenAI embeddings with optional custom base URL.
+
+    Instances are memoized on the resolved settings (base URL, model, context
+    length check and a digest of the API key) so callers share one HTTP client.
+    """
 
     if base_url is None:
         base_url = os.getenv("OPENAI_EMBEDDING_API_BASE")
@@ -147,20 +179,33 @@ def create_embeddings(base_url: Optional[str] = None) -> OpenAIEmbeddings:
             "Embeddings model is not set. Set OPENAI_EMBEDDING_MODEL (or embeddings_model in YAML)."
         )
 
-    kwargs: Dict[str, Any] = {
-        "model": model,
-    }
-
     # Compatibility note:
     # langchain_openai's OpenAIEmbeddings may send token-id arrays (list[int]) when
     # `check_embedding_ctx_length=True` (it tokenizes and passes tokens to the API).
     # Many OpenAI-compatible embedding servers only accept string inputs.
     # Default to string inputs for compatibility, and allow opting back in.
-    kwargs["check_embedding_ctx_length"] = _env_bool(
+    check_ctx_length = _env_bool(
         "OPEN_DEEPWIKI_EMBEDDINGS_CHECK_CTX_LENGTH",
         default=False,
     )
 
+    # The key digest only invalidates the cache when credentials change.
+    api_key_digest = hashlib.sha256(os.getenv("OPENAI_API_KEY", "").encode("utf-8")).hexdigest()[:8]
+    return _create_embeddings_cached(base_url, model, check_ctx_length, api_key_digest)
+
+
+@functools.lru_cache(maxsize=8)
+def _create_embeddings_cached(
+    base_url: str,
+    model: str,
+    check_ctx_length: bool,
+    api_key_digest: str,
+) -> OpenAIEmbeddings:
+    kwargs: Dict[str, Any] = {
+        "model": model,
+        "check_embedding_ctx_length": check_ctx_length,
+    }
+
     for key in ("base_url", "openai_api_base"):
         try:
             return TokenLimitedOpenAIEmbeddings(**{**kwargs, key: base_url})
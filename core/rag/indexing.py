@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
+import itertools
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, MutableMapping, Optional, Tuple
 
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
@@ -9,10 +15,95 @@ from langchain_core.documents import Document
 from core.parsing.java_parser import JavaMethod
 
 
-def _safe_add_documents(vectorstore: Chroma, documents: List[Document], *, ids: Optional[List[str]] = None) -> None:
+def _clean(text: Optional[str]) -> str:
+    """Strip `text` without the extra copies of `str(text or "")` for (large) strings."""
+
+    if isinstance(text, str):
+        return text.strip()
+    return "" if text is None else str(text).strip()
+
+
+def _add_batch_size() -> int:
+    """Documents per Chroma add call (env: CHROMA_ADD_BATCH_SIZE, default 512)."""
+
+    return max(1, int(os.getenv("CHROMA_ADD_BATCH_SIZE", "512")))
+
+
+def _ingest_workers() -> int:
+    """Concurrent Chroma add calls (env: RAG_INGEST_WORKERS, default 8)."""
+
+    return max(1, int(os.getenv("RAG_INGEST_WORKERS", "8")))
+
+
+def _safe_add_documents(
+    vectorstore: Chroma,
+    documents: List[Document],
+    *,
+    ids: Optional[List[str]] = None,
+    batch_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> None:
+    """Add documents in bounded sub-batches, replacing any existing ids.
+
+    Each sub-batch is one embedding request and one Chroma write, so memory and
+    transaction size stay bounded on large repositories. Sub-batches are submitted
+    from a small thread pool so the network-bound embedding calls overlap.
+    """
+
     if not documents:
         return
 
+    size = batch_size if batch_size is not None else _add_batch_size()
+    batches = [
+        (documents[start : start + size], ids[start : start + size] if ids is not None else None)
+        for start in range(0, len(documents), size)
+    ]
+
+    workers = min(len(batches), _ingest_workers() if max_workers is None else max(1, int(max_workers)))
+    if workers <= 1:
+        for batch_docs, batch_ids in batches:
+            _add_documents_batch(vectorstore, batch_docs, ids=batch_ids)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chroma-add") as executor:
+        futures = [
+            executor.submit(_add_documents_batch, vectorstore, batch_docs, ids=batch_ids)
+            for batch_docs, batch_ids in batches
+        ]
+        for future in as_completed(futures):
+            # Re-raise the first failure; the executor still waits for the rest.
+            future.result()
+
+
+def _add_documents_batch(vectorstore: Chroma, documents: List[Document], *, ids: Optional[List[str]]) -> None:
+    """Write one sub-batch with a single `Collection.upsert` (one Chroma transaction).
+
+    Existing ids are replaced in place. Falls back to the store's add path (with a
+    delete + retry on duplicate ids) only when the collection has no `upsert`.
+    """
+
+    upsert = getattr(getattr(vectorstore, "_collection", None), "upsert", None)
+    # Chroma rejects empty metadata dicts; leave those batches to the store wrapper.
+    if upsert is None or not all(d.metadata for d in documents):
+        _add_documents_via_store(vectorstore, documents, ids=ids)
+        return
+
+    texts = [d.page_content for d in documents]
+    kwargs: Dict[str, Any] = {
+        "ids": ids if ids is not None else [str(uuid.uuid4()) for _ in documents],
+        "documents": texts,
+        "metadatas": [d.metadata for d in documents],
+    }
+    # Embed outside Chroma in one request per sub-batch, then write the vectors
+    # directly so the collection never re-embeds them. Without an embedding function
+    # on the wrapper, the collection embeds with its own.
+    embedding = getattr(vectorstore, "embeddings", None)
+    if embedding is not None:
+        kwargs["embeddings"] = embedding.embed_documents(texts)
+    upsert(**kwargs)
+
+
+def _add_documents_via_store(vectorstore: Chroma, documents: List[Document], *, ids: Optional[List[str]]) -> None:
     if ids is None:
         vectorstore.add_documents(documents)
         return
@@ -34,95 +125,150 @@ def _safe_add_documents(vectorstore: Chroma, documents: List[Document], *, ids:
         vectorstore.add_documents(documents, ids=ids)
 
 
-def index_java_methods(methods: List[JavaMethod], vectorstore: Chroma) -> Dict[str, Document]:
+def _content_hash(content: str, metadata: Dict[str, Any]) -> str:
+    """BLAKE2b-128 over a document's text and metadata (hex)."""
+
+    h = hashlib.blake2b(content.encode("utf-8"), digest_size=16)
+    h.update(b"\0")
+    h.update(repr(sorted(metadata.items())).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _drop_unchanged(
+    vectorstore: Chroma, documents: List[Document], ids: List[str]
+) -> Tuple[List[Document], List[str]]:
+    """Drop documents whose stored `content_hash` matches, so they are not re-embedded.
+
+    Stored hashes are read in chunks of `_add_batch_size()` ids (Chroma caps the
+    number of ids per `get`). Best-effort: a chunk that cannot be queried keeps all
+    of its documents.
+    """
+
+    get = getattr(getattr(vectorstore, "_collection", None), "get", None)
+    if get is None or not ids:
+        return documents, ids
+
+    size = _add_batch_size()
+    keep: List[int] = []
+    for start in range(0, len(ids), size):
+        chunk = range(start, min(start + size, len(ids)))
+        try:
+            existing = get(ids=ids[chunk.start : chunk.stop], include=["metadatas"])
+            stored = {
+                doc_id: (meta or {}).get("content_hash")
+                for doc_id, meta in zip(existing.get("ids") or [], existing.get("metadatas") or [])
+            }
+        except Exception:
+            keep.extend(chunk)
+            continue
+        keep.extend(i for i in chunk if stored.get(ids[i]) != documents[i].metadata.get("content_hash"))
+
+    return [documents[i] for i in keep], [ids[i] for i in keep]
+
+
+def _update_metadata_if_text_unchanged(vectorstore: Chroma, doc: Document, doc_id: str) -> bool:
+    """Update only `doc_id`'s metadata if its stored text equals `doc.page_content`.
+
+    Returns:
+        True if the metadata was updated in place, False if the document must be
+        (re)written in full.
+    """
+
+    collection = getattr(vectorstore, "_collection", None)
+    if collection is None or not doc.metadata:
+        return False
+    try:
+        existing = collection.get(ids=[doc_id], include=["documents"])
+        if (existing.get("documents") or [None])[0] != doc.page_content:
+            return False
+        collection.update(ids=[doc_id], metadatas=[doc.metadata])
+    except Exception:
+        return False
+    return True
+
+
+def index_java_methods(
+    methods: List[JavaMethod], vectorstore: Chroma, *, batch_size: Optional[int] = None
+) -> Dict[str, Document]:
     """Index Java methods into the vector store.
 
     Notes:
     - Chroma metadata must contain primitive types.
     - `calls` is serialized as a comma-separated string (tests rely on this).
+    - Documents are added `batch_size` at a time (default: CHROMA_ADD_BATCH_SIZE).
+    - Each document carries a `content_hash`; methods whose stored hash is unchanged
+      are not re-embedded or rewritten.
     """
 
     documents: List[Document] = []
     ids: List[str] = []
     method_docs_map: Dict[str, Document] = {}
+    # Local bindings for the per-method loop.
+    add_document, add_id = documents.append, ids.append
 
     for method in methods:
-        project: Optional[str] = getattr(method, "project", None)
-        file_path: Optional[str] = getattr(method, "file_path", None)
-        start_line: Optional[int] = getattr(method, "start_line", None)
-        end_line: Optional[int] = getattr(method, "end_line", None)
+        project: Optional[str] = method.project
+        file_path: Optional[str] = method.file_path
+        start_line: Optional[int] = method.start_line
+        end_line: Optional[int] = method.end_line
 
         scoped_id = f"{project}::{method.id}" if project else method.id
 
-        content_parts = [
-            f"Signature: {method.signature}",
-            f"Type: {method.type}",
-        ]
-
-        if method.javadoc:
-            content_parts.append(f"Documentation: {method.javadoc}")
-
-        if method.calls:
-            content_parts.append(f"Calls: {', '.join(method.calls)}")
-
-        content_parts.append(f"Code:\n{method.code}")
-
-        content = "\n\n".join(content_parts)
-
+        # The parser emits calls already sorted, so sorting here is a linear check.
         calls_serialized = ", ".join(sorted(method.calls))
-
-        doc = Document(
-            page_content=content,
-            metadata={
-                "id": method.id,
-                "scoped_id": scoped_id,
-                "signature": method.signature,
-                "type": method.type,
-                "calls": calls_serialized,
-                "has_javadoc": method.javadoc is not None,
-                "project": project,
-                "file_path": file_path,
-                "start_line": start_line,
-                "end_line": end_line,
-                "doc_type": "java_method",
-            },
+        javadoc_part = f"Documentation: {method.javadoc}\n\n" if method.javadoc else ""
+        calls_part = f"Calls: {calls_serialized}\n\n" if calls_serialized else ""
+        content = (
+            f"Signature: {method.signature}\n\nType: {method.type}\n\n"
+            f"{javadoc_part}{calls_part}Code:\n{method.code}"
         )
 
-        documents.append(doc)
-        ids.append(scoped_id)
+        metadata: Dict[str, Any] = {
+            "id": method.id,
+            "scoped_id": scoped_id,
+            "signature": method.signature,
+            # Precomputed for the retriever's call matching.
+            "signature_lower": method.signature.lower(),
+            "type": method.type,
+            "calls": calls_serialized,
+            "has_javadoc": method.javadoc is not None,
+            "project": project,
+            "file_path": file_path,
+            "start_line": start_line,
+            "end_line": end_line,
+            "doc_type": "java_method",
+        }
+        metadata["content_hash"] = _content_hash(content, metadata)
+
+        doc = Document(page_content=content, metadata=metadata)
+
+        add_document(doc)
+        add_id(scoped_id)
         method_docs_map[method.id] = doc
 
-    _safe_add_documents(vectorstore, documents, ids=ids)
+    documents, ids = _drop_unchanged(vectorstore, documents, ids)
+    _safe_add_documents(vectorstore, documents, ids=ids, batch_size=batch_size)
 
     return method_docs_map
 
 
-def index_java_file_summaries(methods: List[JavaMethod], vectorstore: Chroma) -> Dict[Tuple[Optional[str], str], Document]:
-    """Index one summary document per Java file.
-
-    Summary is heuristic (no LLM). It helps RAG answer file-level questions.
-    """
+def _iter_file_summary_documents(methods: List[JavaMethod]) -> Iterator[Document]:
+    """Yield one heuristic summary document per Java file, in first-seen file order."""
 
+    # Parsed methods arrive grouped by file, so group contiguous runs and touch the
+    # dict once per run; a file that reappears later is still merged.
     by_file: Dict[str, List[JavaMethod]] = {}
-    for m in methods:
-        fp = getattr(m, "file_path", None) or "(unknown)"
-        by_file.setdefault(fp, []).append(m)
-
-    documents: List[Document] = []
-    ids: List[str] = []
-    out: Dict[Tuple[Optional[str], str], Document] = {}
+    for fp, run in itertools.groupby(methods, key=lambda m: m.file_path or "(unknown)"):
+        by_file.setdefault(fp, []).extend(run)
 
     for file_path, file_methods in by_file.items():
-        project: Optional[str] = getattr(file_methods[0], "project", None)
+        project: Optional[str] = file_methods[0].project
         scoped_id = f"{project}::file::{file_path}" if project else f"file::{file_path}"
 
         # Stable, compact summary text.
-        sigs = [m.signature for m in file_methods if m.signature]
-        sigs = list(dict.fromkeys(sigs))  # preserve order, de-dup
-        calls: List[str] = []
-        for m in file_methods:
-            calls.extend(list(m.calls or []))
-        calls = sorted(set(calls))
+        sigs = list(dict.fromkeys(m.signature for m in file_methods if m.signature))  # preserve order, de-dup
+        # Only the first 120 unique calls (sorted) are rendered.
+        calls = heapq.nsmallest(120, set().union(*(m.calls or () for m in file_methods)))
 
         content_parts = [
             f"File: {file_path}",
@@ -134,9 +280,9 @@ def index_java_file_summaries(methods: List[JavaMethod], vectorstore: Chroma) ->
         if sigs:
             content_parts.append("Signatures:\n- " + "\n- ".join(sigs[:80]))
         if calls:
-            content_parts.append("Calls (unique): " + ", ".join(calls[:120]))
+            content_parts.append("Calls (unique): " + ", ".join(calls))
 
-        doc = Document(
+        yield Document(
             page_content="\n\n".join(content_parts),
             metadata={
                 "scoped_id": scoped_id,
@@ -145,14 +291,74 @@ def index_java_file_summaries(methods: List[JavaMethod], vectorstore: Chroma) ->
                 "doc_type": "java_file_summary",
             },
         )
+
+
+def index_java_file_summaries(
+    methods: List[JavaMethod], vectorstore: Chroma, *, batch_size: Optional[int] = None
+) -> Dict[Tuple[Optional[str], str], Document]:
+    """Index one summary document per Java file.
+
+    Summary is heuristic (no LLM). It helps RAG answer file-level questions.
+    """
+
+    documents: List[Document] = []
+    ids: List[str] = []
+    out: Dict[Tuple[Optional[str], str], Document] = {}
+
+    for doc in _iter_file_summary_documents(methods):
         documents.append(doc)
-        ids.append(scoped_id)
-        out[(project, file_path)] = doc
+        ids.append(doc.metadata["scoped_id"])
+        out[(doc.metadata["project"], doc.metadata["file_path"])] = doc
 
-    _safe_add_documents(vectorstore, documents, ids=ids)
+    _safe_add_documents(vectorstore, documents, ids=ids, batch_size=batch_size)
     return out
 
 
+def stream_java_file_summaries(
+    methods: List[JavaMethod],
+    vectorstore: Chroma,
+    sink: MutableMapping[str, str],
+    *,
+    batch_size: Optional[int] = None,
+) -> int:
+    """Index per-file summaries like `index_java_file_summaries`, without keeping them.
+
+    Each summary text is written to `sink` (file path -> summary) as it is produced,
+    and documents are flushed to Chroma in bounded rounds (one sub-batch per ingest
+    worker), so only one round of `Document` objects is alive at a time. With a
+    disk-backed sink (see `FileSummaryStore`) peak memory no longer grows with the
+    number of files.
+
+    Returns:
+        Number of summaries indexed.
+    """
+
+    size = batch_size if batch_size is not None else _add_batch_size()
+    flush_at = size * _ingest_workers()
+    pending: List[Document] = []
+    count = 0
+
+    def _flush() -> None:
+        _safe_add_documents(
+            vectorstore,
+            pending,
+            ids=[d.metadata["scoped_id"] for d in pending],
+            batch_size=size,
+        )
+        pending.clear()
+
+    for doc in _iter_file_summary_documents(methods):
+        sink[str(doc.metadata["file_path"])] = doc.page_content
+        pending.append(doc)
+        count += 1
+        if len(pending) >= flush_at:
+            _flush()
+
+    if pending:
+        _flush()
+    return count
+
+
 def index_project_overview(
     *,
     project: Optional[str],
@@ -180,14 +386,41 @@ def index_project_overview(
         metadata["indexed_at"] = str(indexed_at)
 
     doc = Document(
-        page_content=str(overview_text or "").strip(),
+        page_content=_clean(overview_text),
         metadata=metadata,
     )
 
-    _safe_add_documents(vectorstore, [doc], ids=[scoped_id])
+    # The overview is often re-indexed with the same text and only a new timestamp;
+    # then only the metadata is updated and nothing is re-embedded.
+    if not _update_metadata_if_text_unchanged(vectorstore, doc, scoped_id):
+        _safe_add_documents(vectorstore, [doc], ids=[scoped_id])
     return doc
 
 
+def _walk_markdown(root: Path) -> Iterator[Path]:
+    """Yield `*.md` files under `root`, using scandir's cached entry types (no extra stat)."""
+
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
+def _read_markdown(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding="utf-8")
+    except Exception:
+        return None
+
+
 def index_generated_markdown_docs(
     *,
     project: Optional[str],
@@ -217,13 +450,14 @@ def index_generated_markdown_docs(
     documents: List[Document] = []
     ids: List[str] = []
 
-    for path in sorted(root.rglob("*.md")):
-        if not path.is_file():
-            continue
+    paths = sorted(_walk_markdown(root))
 
-        try:
-            text = path.read_text(encoding="utf-8")
-        except Exception:
+    # Many small files: overlap the reads on a thread pool (map keeps path order).
+    with ThreadPoolExecutor(max_workers=16, thread_name_prefix="md-read") as executor:
+        texts = list(executor.map(_read_markdown, paths))
+
+    for path, text in zip(paths, texts):
+        if text is None:
             # Best-effort; skip unreadable generated docs.
             continue
 
@@ -235,7 +469,7 @@ def index_generated_markdown_docs(
         scoped_id = f"{project}::docs::{rel}" if project else f"docs::{rel}"
 
         doc = Document(
-            page_content=str(text or "").strip(),
+            page_content=_clean(text),
             metadata={
                 "scoped_id": scoped_id,
                 "project": project,
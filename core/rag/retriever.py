@@ -1,12 +1,28 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from langchain_chroma import Chroma
 from langchain_core.callbacks.manager import CallbackManagerForRetrieverRun
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, PrivateAttr
+
+# Enriched results kept per retriever (least recently used evicted first).
+_RESULT_CACHE_SIZE = 256
+
+# (query, project, k, method map version) -> enriched documents.
+_CacheKey = Tuple[str, Optional[str], int, Tuple[int, int]]
+
+# Concurrent searches in `get_relevant_documents_batch`.
+_BATCH_SEARCH_WORKERS = 8
+
+# Identifier tokens of a lowercased Java signature (same rule as the project graph).
+_SIGNATURE_TOKEN_RE = re.compile(r"[a-z_$][a-z0-9_$]*")
 
 
 class GraphEnrichedRetriever(BaseRetriever):
@@ -19,25 +35,126 @@ class GraphEnrichedRetriever(BaseRetriever):
     project: Optional[str] = None
     method_docs_map: Dict[str, Document] = Field(default_factory=dict)
 
-    def _get_relevant_documents(
-        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
-    ) -> List[Document]:
-        search_filter: Optional[Dict[str, Any]] = {"doc_type": "java_method"}
-        if self.project is not None:
-            # Chroma's `where` expects either a single field predicate or a single
-            # boolean operator (e.g. {"$and": [...]}) when combining predicates.
-            search_filter = {
-                "$and": [
-                    {"doc_type": "java_method"},
-                    {"project": self.project},
-                ]
-            }
+    # Signature token -> method ids, built lazily from `method_docs_map` and rebuilt
+    # when the map is replaced (callers reassign it on re-index) or changes size. The
+    # source map is referenced so its id cannot be reused by a later map.
+    _sig_index: Dict[str, List[str]] = PrivateAttr(default_factory=dict)
+    _sig_index_map: Optional[Dict[str, Document]] = PrivateAttr(default=None)
+    _sig_index_version: Optional[Tuple[int, int]] = PrivateAttr(default=None)
+
+    # Cleared whenever `method_docs_map` is replaced (see `_sync_result_cache`).
+    _result_cache: "OrderedDict[_CacheKey, List[Document]]" = PrivateAttr(default_factory=OrderedDict)
+    _result_cache_map: Optional[Dict[str, Document]] = PrivateAttr(default=None)
+    _result_cache_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def _search_filter(self) -> Dict[str, Any]:
+        if self.project is None:
+            return {"doc_type": "java_method"}
+        # Chroma's `where` expects either a single field predicate or a single
+        # boolean operator (e.g. {"$and": [...]}) when combining predicates.
+        return {
+            "$and": [
+                {"doc_type": "java_method"},
+                {"project": self.project},
+            ]
+        }
+
+    def _map_version(self) -> Tuple[int, int]:
+        """Identity and size of `method_docs_map`; changes when the map is swapped or grows."""
+
+        return (id(self.method_docs_map), len(self.method_docs_map))
+
+    def _cache_key(self, query: str) -> _CacheKey:
+        return (query, self.project, self.k, self._map_version())
+
+    def _sync_result_cache(self) -> None:
+        """Drop cached results built from a previous `method_docs_map` (lock held)."""
+
+        if self._result_cache_map is not self.method_docs_map:
+            self._result_cache.clear()
+            self._result_cache_map = self.method_docs_map
+
+    def _cached(self, key: _CacheKey) -> Optional[List[Document]]:
+        with self._result_cache_lock:
+            self._sync_result_cache()
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+                return list(cached)
+        return None
+
+    def _store(self, key: _CacheKey, docs: List[Document]) -> None:
+        with self._result_cache_lock:
+            self._sync_result_cache()
+            if key[3] != self._map_version():
+                # The map was replaced while searching; these results are already stale.
+                return
+            self._result_cache[key] = docs
+            while len(self._result_cache) > _RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+    def _search(self, query: str) -> List[Document]:
+        """Run the vector search for `query` and enrich the hits (no caching)."""
+
+        search_filter = self._search_filter()
 
         try:
             initial_docs = self.vectorstore.similarity_search(query, k=self.k, filter=search_filter)
         except TypeError:
             initial_docs = self.vectorstore.similarity_search(query, k=self.k)
 
+        return self._enrich(initial_docs)
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        key = self._cache_key(query)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        docs = self._search(query)
+        self._store(key, docs)
+        return list(docs)
+
+    @staticmethod
+    def _signature_lower(dep_doc: Document) -> str:
+        metadata = dep_doc.metadata or {}
+        # `signature_lower` is written at index time; older documents lack it.
+        signature = metadata.get("signature_lower")
+        if signature is None:
+            signature = str(metadata.get("signature") or "").lower()
+        return signature
+
+    def _signature_index(self) -> Dict[str, List[str]]:
+        version = self._map_version()
+        if self._sig_index_version != version:
+            index: Dict[str, List[str]] = defaultdict(list)
+            for method_id, dep_doc in self.method_docs_map.items():
+                signature = self._signature_lower(dep_doc)
+                for token in dict.fromkeys(_SIGNATURE_TOKEN_RE.findall(signature)):
+                    index[token].append(method_id)
+            self._sig_index = dict(index)
+            self._sig_index_map = self.method_docs_map
+            self._sig_index_version = version
+        return self._sig_index
+
+    def _methods_called(self, call_name: str) -> List[str]:
+        """Return ids of methods whose signature contains `call_name` as a whole token."""
+
+        needle = call_name.lower()
+        if _SIGNATURE_TOKEN_RE.fullmatch(needle):
+            return self._signature_index().get(needle, [])
+        # Qualified or unusual names: fall back to a substring scan.
+        return [
+            method_id
+            for method_id, dep_doc in self.method_docs_map.items()
+            if needle in self._signature_lower(dep_doc)
+        ]
+
+    def _enrich(self, initial_docs: List[Document]) -> List[Document]:
+        """Append the documents of methods called by `initial_docs` (deduplicated)."""
+
         enriched_docs: List[Document] = []
         seen_ids = set()
 
@@ -54,23 +171,56 @@ class GraphEnrichedRetriever(BaseRetriever):
                 calls = list(calls_meta or [])
 
             for call_name in calls:
-                for method_id, dep_doc in self.method_docs_map.items():
-                    if call_name.lower() in dep_doc.metadata.get("signature", "").lower():
-                        dep_key = (dep_doc.metadata or {}).get("scoped_id") or (dep_doc.metadata or {}).get("id") or method_id
-                        if dep_key not in seen_ids:
-                            enriched_doc = Document(
-                                page_content=f"[DEPENDENCY] {dep_doc.page_content}",
-                                metadata={
-                                    **(dep_doc.metadata or {}),
-                                    "is_dependency": True,
-                                    "called_from": (doc.metadata or {}).get("scoped_id")
-                                    or (doc.metadata or {}).get("id"),
-                                },
-                            )
-                            enriched_docs.append(enriched_doc)
-                            seen_ids.add(dep_key)
+                for method_id in self._methods_called(call_name):
+                    dep_doc = self.method_docs_map[method_id]
+                    dep_key = (dep_doc.metadata or {}).get("scoped_id") or (dep_doc.metadata or {}).get("id") or method_id
+                    if dep_key not in seen_ids:
+                        enriched_doc = Document(
+                            page_content=f"[DEPENDENCY] {dep_doc.page_content}",
+                            metadata={
+                                **(dep_doc.metadata or {}),
+                                "is_dependency": True,
+                                "called_from": (doc.metadata or {}).get("scoped_id")
+                                or (doc.metadata or {}).get("id"),
+                            },
+                        )
+                        enriched_docs.append(enriched_doc)
+                        seen_ids.add(dep_key)
 
         return enriched_docs
 
+    def get_relevant_documents_batch(self, queries: Sequence[str]) -> List[List[Document]]:
+        """Retrieve enriched documents for several queries at once.
+
+        Each query goes through the same search as `get_relevant_documents` (so it is
+        embedded exactly as a single query would be) and shares its result cache.
+        Queries not in the cache are searched concurrently, since each search is
+        dominated by its embedding request.
+
+        Args:
+            queries: Query strings.
+
+        Returns:
+            One list of documents per query, in input order.
+        """
+
+        keys = [self._cache_key(q) for q in queries]
+        results: List[Optional[List[Document]]] = [self._cached(key) for key in keys]
+
+        # Duplicate queries are searched once.
+        pending: Dict[_CacheKey, str] = {
+            key: query for query, key, docs in zip(queries, keys, results) if docs is None
+        }
+        if pending:
+            with ThreadPoolExecutor(
+                max_workers=min(len(pending), _BATCH_SEARCH_WORKERS), thread_name_prefix="retriever"
+            ) as executor:
+                found = dict(zip(pending, executor.map(self._search, pending.values())))
+            for key, docs in found.items():
+                self._store(key, docs)
+            results = [docs if docs is not None else list(found[key]) for key, docs in zip(keys, results)]
+
+        return [docs or [] for docs in results]
+
     def get_relevant_documents(self, query: str) -> List[Document]:
         return self.invoke(query)
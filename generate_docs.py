@@ -16,6 +16,7 @@ from core.documentation.feature_extractor import (
     summarize_file_semantically,
 )
 from core.documentation.site_generator import write_feature_docs_site
+from core.documentation.summary_store import FileSummaryStore
 from core.rag.embeddings import create_embeddings
 from core.rag.indexing import index_project_overview
 from indexer import iter_java_files
@@ -145,47 +146,47 @@ def generate_docs(
 
     grouped = _group_by_parent_folder(root_dir, java_paths)
 
-    file_summaries_by_folder: Dict[Path, List[str]] = {}
-    file_summaries_by_path: Dict[str, str] = {}
-    total_files = 0
-
-    for folder, files in grouped.items():
-        summaries: List[str] = []
-        for file_path in files:
-            code = _read_text_best_effort(file_path)
-            summary = summarize_file_semantically(file_path, code, llm)
-            summaries.append(summary)
-            file_summaries_by_path[str(file_path)] = summary
-            total_files += 1
-        file_summaries_by_folder[folder] = summaries
-
-    logger.info("Generated %d file summaries", total_files)
-
-    module_summaries: Dict[str, str] = {}
-    for folder, summaries in file_summaries_by_folder.items():
-        key = _folder_key(root_dir, folder)
-        module_summaries[key] = generate_module_summary(folder, summaries, llm)
-
-    overview = generate_project_overview(root_dir, module_summaries, llm)
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(overview, encoding="utf-8")
-    logger.info("Wrote project overview to %s", output_path)
-
-    if site_output_dir is not None:
-        try:
-            write_feature_docs_site(
-                output_dir=site_output_dir,
-                project_overview=overview,
-                file_summaries=file_summaries_by_path,
-                llm=llm,
-                batch_size=10,
-            )
-            logger.info("Wrote feature docs site to %s", site_output_dir)
-        except Exception as e:
-            raise RuntimeError(
-                f"Feature-based docs site generation failed: {type(e).__name__}: {e}"
-            ) from e
+    # Summaries are spilled to disk; only one folder's worth is loaded at a time.
+    file_summaries_by_path = FileSummaryStore()
+    try:
+        total_files = 0
+        for files in grouped.values():
+            for file_path in files:
+                code = _read_text_best_effort(file_path)
+                summary = summarize_file_semantically(file_path, code, llm)
+                file_summaries_by_path[str(file_path)] = summary
+                total_files += 1
+
+        logger.info("Generated %d file summaries", total_files)
+
+        module_summaries: Dict[str, str] = {}
+        for folder, files in grouped.items():
+            key = _folder_key(root_dir, folder)
+            summaries = file_summaries_by_path.mget(str(p) for p in files)
+            module_summaries[key] = generate_module_summary(folder, summaries, llm)
+
+        overview = generate_project_overview(root_dir, module_summaries, llm)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(overview, encoding="utf-8")
+        logger.info("Wrote project overview to %s", output_path)
+
+        if site_output_dir is not None:
+            try:
+                write_feature_docs_site(
+                    output_dir=site_output_dir,
+                    project_overview=overview,
+                    file_summaries=file_summaries_by_path,
+                    llm=llm,
+                    batch_size=10,
+                )
+                logger.info("Wrote feature docs site to %s", site_output_dir)
+            except Exception as e:
+                raise RuntimeError(
+                    f"Feature-based docs site generation failed: {type(e).__name__}: {e}"
+                ) from e
+    finally:
+        file_summaries_by_path.close()
 
     if index_into_chroma:
         project_name: Optional[str] = getattr(config, "project_name", None) or os.getenv(
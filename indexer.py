@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Iterable, List, Optional, Protocol
+from typing import AsyncIterator, Callable, Iterable, List, Optional, Protocol, Tuple
 
 from dotenv import load_dotenv
 from langchain_chroma import Chroma
@@ -12,12 +14,16 @@ from langchain_chroma import Chroma
 from config import (AppConfig, apply_config_to_env, configure_logging,
                     load_config, prefetch_tiktoken_encodings)
 from core.parsing.java_parser import JavaMethod, JavaParser
+from core.parsing.parse_cache import SqliteParseCache
 from core.parsing.tree_sitter_setup import setup_java_language
 from core.rag.embeddings import create_embeddings
 from core.rag.indexing import index_java_file_summaries, index_java_methods
 
 logger = logging.getLogger(__name__)
 
+# Directory names never descended into when looking for Java sources.
+_JAVA_SKIP_DIRS = frozenset({".git", ".venv", "venv", "build", "vendor", "chroma_db", "__pycache__"})
+
 
 class JavaParserLike(Protocol):
     """Structural type for parsers that can extract Java methods.
@@ -72,44 +78,62 @@ def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def _is_test_java_path(path: Path, *, root: Path) -> bool:
-    """Return True when a Java file is located under a directory named "test".
+def iter_java_files(root_dir: str, *, exclude_tests: bool = True) -> Iterable[Path]:
+    """Yield Java source files under a directory.
 
-    This is intentionally strict (no filename heuristics). Only paths whose
-    relative components include a folder literally named "test" are excluded.
+    Args:
+        root_dir: Root directory to scan recursively.
+        exclude_tests: If True (default), filters out Java files that are located
+            under a directory named "test" (e.g., under src/test/java).
 
-    Examples excluded:
-        - src/test/java/com/example/Foo.java
-        - test/com/example/Foo.java
+    Yields:
+        Paths to discovered .java files.
+    """
 
-    Examples included:
-        - src/tests/java/... (folder "tests" is NOT excluded)
-        - src/main/java/.../PaymentServiceTest.java (filename is NOT used)
+    root = Path(root_dir)
+    if not root.exists():
+        return []
 
-    Args:
-        path: Candidate filesystem path (file).
-        root: Root directory being scanned.
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Prune on plain directory names; no Path objects per directory.
+        dirnames[:] = [
+            d
+            for d in dirnames
+            if d not in _JAVA_SKIP_DIRS and not (exclude_tests and d.lower() == "test")
+        ]
+
+        # With exclude_tests, any directory literally named "test" (case-insensitive,
+        # e.g. src/test/java) is pruned above, so every remaining file is kept. "tests"
+        # directories and *Test.java filenames are not excluded.
+        for filename in filenames:
+            if filename.endswith(".java"):
+                yield Path(dirpath, filename)
 
-    Returns:
-        True if the path is under a "test" directory.
-    """
 
-    try:
-        rel = path.resolve().relative_to(root.resolve())
-    except Exception:
-        rel = path
+def _default_walk_concurrency() -> int:
+    """Default number of directories listed concurrently by `aiter_java_files()`."""
 
-    parts_lower = [p.lower() for p in rel.parts]
-    return "test" in parts_lower
+    return min(32, (os.cpu_count() or 1) * 2)
 
 
-def iter_java_files(root_dir: str, *, exclude_tests: bool = True) -> Iterable[Path]:
-    """Yield Java source files under a directory.
+async def aiter_java_files(
+    root_dir: str,
+    *,
+    exclude_tests: bool = True,
+    max_concurrency: Optional[int] = None,
+) -> AsyncIterator[Path]:
+    """Asynchronously yield Java source files under a directory.
+
+    Same selection rules as `iter_java_files()`, but sibling directories are listed
+    concurrently (`os.scandir` in worker threads), which overlaps directory metadata
+    reads on cold caches and network filesystems. Files are yielded as their
+    directory listing completes, so the order is not deterministic.
 
     Args:
         root_dir: Root directory to scan recursively.
-        exclude_tests: If True (default), filters out Java files that are located
-            under a directory named "test" (e.g., under src/test/java).
+        exclude_tests: If True (default), skips directories named "test".
+        max_concurrency: Maximum number of directories listed at once. Defaults to
+            min(32, 2 * CPU count).
 
     Yields:
         Paths to discovered .java files.
@@ -117,27 +141,51 @@ def iter_java_files(root_dir: str, *, exclude_tests: bool = True) -> Iterable[Pa
 
     root = Path(root_dir)
     if not root.exists():
-        return []
-
-    def _should_skip_dir(p: Path) -> bool:
-        name = p.name
-        if name in {".git", ".venv", "venv", "build", "vendor", "chroma_db", "__pycache__"}:
-            return True
-        if exclude_tests and name.lower() == "test":
-            return True
-        return False
-
-    for dirpath, dirnames, filenames in os.walk(root):
-        dirnames[:] = [d for d in dirnames if not _should_skip_dir(Path(dirpath) / d)]
+        return
 
-        for filename in filenames:
-            if not filename.endswith(".java"):
-                continue
+    semaphore = asyncio.Semaphore(max(1, max_concurrency or _default_walk_concurrency()))
 
-            path = Path(dirpath) / filename
-            if exclude_tests and _is_test_java_path(path, root=root):
-                continue
-            yield path
+    def _list_dir(path: str) -> Tuple[List[str], List[str]]:
+        subdirs: List[str] = []
+        java_files: List[str] = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            # Like os.walk(): symlinked directories are not followed.
+                            name = entry.name
+                            if (
+                                not entry.is_symlink()
+                                and name not in _JAVA_SKIP_DIRS
+                                and not (exclude_tests and name.lower() == "test")
+                            ):
+                                subdirs.append(entry.path)
+                        elif entry.name.endswith(".java"):
+                            java_files.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            # Unreadable directories are skipped, as os.walk() does by default.
+            pass
+        return subdirs, java_files
+
+    async def _scan(path: str) -> Tuple[List[str], List[str]]:
+        async with semaphore:
+            return await asyncio.to_thread(_list_dir, path)
+
+    pending = {asyncio.ensure_future(_scan(str(root)))}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                subdirs, java_files = task.result()
+                pending.update(asyncio.ensure_future(_scan(d)) for d in subdirs)
+                for file_path in java_files:
+                    yield Path(file_path)
+    finally:
+        for task in pending:
+            task.cancel()
 
 
 def iter_resource_files(root_dir: str, extensions: List[str], exclude: Optional[List[str]] = None) -> Iterable[Path]:
@@ -156,13 +204,20 @@ def iter_resource_files(root_dir: str, extensions: List[str], exclude: Optional[
     if exclude:
         exclude_dirs.update(exclude)
 
+    # Set lookup per file, and a Path is only built for files that match.
+    wanted = frozenset(extensions)
     for dirpath, dirnames, filenames in os.walk(root):
         dirnames[:] = [d for d in dirnames if d not in exclude_dirs]
         
         for filename in filenames:
-            path = Path(dirpath) / filename
-            if path.suffix.lower() in extensions:
-                 yield path
+            if os.path.splitext(filename)[1].lower() in wanted:
+                yield Path(dirpath) / filename
+
+
+def _default_scan_workers() -> int:
+    """Default thread count for `scan_java_methods()` (bounded; parsing is partly GIL-bound)."""
+
+    return max(1, min(8, os.cpu_count() or 1))
 
 
 def scan_java_methods(
@@ -171,9 +226,15 @@ def scan_java_methods(
     *,
     exclude_tests: bool = True,
     progress_callback: Optional[Callable[[int, int, Optional[str]], None]] = None,
+    max_workers: Optional[int] = None,
+    parse_cache: Optional[SqliteParseCache] = None,
 ) -> List[JavaMethod]:
     """Scan a directory for Java files and parse methods/constructors.
 
+    Files are read and parsed on a thread pool. `JavaParser` keeps one tree-sitter
+    parser per thread, so a single instance can be shared by the workers. Results
+    and progress callbacks are delivered on the calling thread, in file order.
+
     Args:
         codebase_dir: Root directory to scan.
         parser: Initialized JavaParser (tree-sitter backed).
@@ -184,6 +245,10 @@ def scan_java_methods(
             - processed_files: Number of files completed so far.
             - total_files: Total number of Java files that will be scanned.
             - current_file: Path of the file that was just processed (or None at start).
+        max_workers: Number of worker threads. Defaults to min(8, CPU count);
+            1 scans sequentially on the calling thread.
+        parse_cache: Optional persistent cache of parse results. Files whose content
+            hash matches a cached entry are not re-parsed.
 
     Returns:
         List of parsed JavaMethod objects.
@@ -198,31 +263,53 @@ def scan_java_methods(
     if progress_callback is not None:
         progress_callback(0, total_files, None)
 
-    processed_files = 0
-
-    for path in files:
+    def _parse_one(path: Path) -> List[JavaMethod]:
         try:
             java_code = path.read_text(encoding="utf-8")
         except Exception as e:
             logger.warning("Skipping unreadable file %s: %s", path, e)
-            processed_files += 1
-            if progress_callback is not None:
-                progress_callback(processed_files, total_files, str(path))
-            continue
+            return []
+
+        file_path = str(path)
+        digest = b""
+        if parse_cache is not None:
+            digest = parse_cache.content_hash(java_code)
+            cached = parse_cache.get(file_path, digest)
+            if cached is not None:
+                return cached
 
         try:
-            file_methods = parser.parse_java_file(java_code, file_path=str(path))
-            methods.extend(file_methods)
+            file_methods = parser.parse_java_file(java_code, file_path=file_path)
         except Exception as e:
             logger.warning("Skipping unparsable file %s: %s", path, e)
+            return []
+
+        if parse_cache is not None:
+            parse_cache.put(file_path, digest, file_methods)
+        return file_methods
+
+    workers = _default_scan_workers() if max_workers is None else max(1, int(max_workers))
+    workers = min(workers, max(total_files, 1))
+
+    processed_files = 0
+
+    def _collect(results: Iterable[List[JavaMethod]]) -> None:
+        nonlocal processed_files
+        for path, file_methods in zip(files, results):
+            methods.extend(file_methods)
             processed_files += 1
             if progress_callback is not None:
                 progress_callback(processed_files, total_files, str(path))
-            continue
 
-        processed_files += 1
-        if progress_callback is not None:
-            progress_callback(processed_files, total_files, str(path))
+    if workers == 1:
+        _collect(map(_parse_one, files))
+    else:
+        # Executor.map yields in submission order, so output matches a sequential scan.
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="java-scan") as executor:
+            _collect(executor.map(_parse_one, files))
+
+    if parse_cache is not None:
+        parse_cache.commit()
 
     if progress_callback is not None:
         progress_callback(processed_files, total_files, "")
@@ -292,6 +379,22 @@ def _get_vectorstore() -> Chroma:
     )
 
 
+def open_parse_cache(config: Optional[AppConfig]) -> Optional[SqliteParseCache]:
+    """Open the persistent parse cache if `parse_cache_sqlite_path` is configured.
+
+    Args:
+        config: Loaded application config (may be None).
+
+    Returns:
+        An open SqliteParseCache, or None when caching is disabled.
+    """
+
+    path = getattr(config, "parse_cache_sqlite_path", None)
+    if not path:
+        return None
+    return SqliteParseCache(sqlite_path=str(path))
+
+
 def index_codebase(config: AppConfig) -> int:
     if not os.getenv("OPENAI_API_KEY"):
         raise RuntimeError("OPENAI_API_KEY is not set; indexing requires embeddings.")
@@ -300,11 +403,17 @@ def index_codebase(config: AppConfig) -> int:
     setup_java_language()
 
     parser = JavaParser()
-    methods = scan_java_methods(
-        config.java_codebase_dir,
-        parser,
-        exclude_tests=bool(getattr(config, "index_exclude_tests", True)),
-    )
+    parse_cache = open_parse_cache(config)
+    try:
+        methods = scan_java_methods(
+            config.java_codebase_dir,
+            parser,
+            exclude_tests=bool(getattr(config, "index_exclude_tests", True)),
+            parse_cache=parse_cache,
+        )
+    finally:
+        if parse_cache is not None:
+            parse_cache.close()
 
     project = getattr(config, "project_name", None) or os.getenv("OPEN_DEEPWIKI_PROJECT")
     if project:
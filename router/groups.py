@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 
 from core.database import get_session
@@ -8,6 +9,10 @@ from core.security import get_current_admin_user
 
 router = APIRouter()
 
+# GroupRead serializes users and projects; load both with one IN query each
+# instead of two lazy loads per group.
+_GROUP_RELATIONSHIPS = (selectinload(Group.users), selectinload(Group.projects))
+
 @router.get("/", response_model=list[GroupRead])
 async def read_groups(
     session: Session = Depends(get_session),
@@ -26,10 +31,9 @@ async def read_groups(
     Returns:
         List of groups with their users and projects.
     """
-    groups = session.exec(select(Group).offset(offset).limit(limit)).all()
-    # SQLModel doesn't auto-fetch relationships for some reason in response unless accessed?
-    # Actually Pydantic v2 traversal should handle it if relationship is loaded.
-    # To be safe we might need to eager load or let lazy loading work if session is open.
+    groups = session.exec(
+        select(Group).options(*_GROUP_RELATIONSHIPS).offset(offset).limit(limit)
+    ).all()
     return groups
 
 @router.get("/{group_id}", response_model=GroupRead)
@@ -51,7 +55,7 @@ async def read_group(
     Raises:
         HTTPException: If the group is not found.
     """
-    db_group = session.get(Group, group_id)
+    db_group = session.get(Group, group_id, options=_GROUP_RELATIONSHIPS)
     if not db_group:
         raise HTTPException(status_code=404, detail="Group not found")
     return db_group
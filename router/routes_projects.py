@@ -353,8 +353,8 @@ def _delete_project_scope(request: Request, *, normalized_project: str) -> Delet
         )
         from core.project_graph import SqliteProjectGraphStore
 
-        store = SqliteProjectGraphStore(sqlite_path=graph_path)
-        store.rebuild(project=normalized_project, methods=[])
+        with SqliteProjectGraphStore(sqlite_path=graph_path) as store:
+            store.rebuild(project=normalized_project, methods=[])
         deleted_graph = True
     except Exception as e:
         logger.warning("Failed to delete project graph data (project=%s): %s", normalized_project, e)
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import logging
 import os
+import queue
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 # External libraries
 from langchain_openai import ChatOpenAI
@@ -14,16 +15,18 @@ from langchain_openai import ChatOpenAI
 from core.documentation.feature_extractor import (generate_module_summary,
                                                   generate_project_overview)
 from core.documentation.site_generator import write_feature_docs_site
+from core.documentation.summary_store import FileSummaryStore
 from core.parsing.generic_parser import GenericAppParser
 from core.parsing.java_parser import JavaParser
 from core.parsing.tree_sitter_setup import setup_java_language
 from core.project_graph import SqliteProjectGraphStore
-from core.rag.indexing import (index_generated_markdown_docs,
-                               index_java_file_summaries, index_java_methods,
-                               index_project_overview)
+from core.rag.indexing import (_safe_add_documents,
+                               index_generated_markdown_docs,
+                               index_java_methods, index_project_overview,
+                               stream_java_file_summaries)
 from core.rag.retriever import GraphEnrichedRetriever
 # Internal imports
-from indexer import scan_java_methods, scan_resource_files
+from indexer import open_parse_cache, scan_java_methods, scan_resource_files
 from utils.vectorstore import (_get_vectorstore, _load_method_docs_map,
                                delete_scoped_documents)
 
@@ -31,6 +34,62 @@ logger = logging.getLogger(__name__)
 
 INDEXING_LOCK = threading.Lock()
 
+class _VectorstoreWriter:
+    """Single background thread that runs vectorstore write tasks in submission order.
+
+    The indexing job produces documents (resource chunks, generated markdown, the
+    project overview) while it is still waiting on LLM calls. Handing the writes to
+    this thread lets embedding + Chroma I/O overlap with generation. Tasks run one at
+    a time, but a task may itself write concurrently: `_safe_add_documents` spreads
+    its sub-batches over up to RAG_INGEST_WORKERS threads.
+    """
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[Optional[Callable[[], None]]]" = queue.Queue()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._run, name="open-deepwiki-vectorstore-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    return
+                # After a failure, drain remaining tasks without running them.
+                if self._error is None:
+                    task()
+            except BaseException as e:  # re-raised by join()
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def submit(self, task: Callable[[], None]) -> None:
+        """Queue a write to run on the writer thread."""
+
+        self._queue.put(task)
+
+    def add_documents(self, vectorstore: Any, documents: List[Any]) -> None:
+        """Queue `documents` for insertion with `_safe_add_documents`."""
+
+        self.submit(lambda: _safe_add_documents(vectorstore, documents))
+
+    def close(self) -> None:
+        """Wait for every queued write and stop the thread. Safe to call more than once."""
+
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def join(self) -> None:
+        """Like close(), then re-raise the first error raised by a queued write."""
+
+        self.close()
+        if self._error is not None:
+            raise self._error
+
 
 def set_indexing_status(
     app_state: Any,
@@ -134,12 +193,18 @@ def run_index_directory_job(
     started_at = datetime.now(timezone.utc).isoformat()
     set_indexing_status(app_state, project=project, status="in_progress", started_at=started_at)
 
+    writer: Optional[_VectorstoreWriter] = None
     try:
         # Serialize indexing operations within this process to avoid concurrent writes
         # to shared resources (vectorstore + tree-sitter build artifacts).
         with INDEXING_LOCK:
             setup_java_language()
-            parser = JavaParser()
+            # One parser per process: its tree cache carries over between index jobs,
+            # so re-indexing a project reuses (or incrementally re-parses) its trees.
+            parser = getattr(app_state, "java_parser", None)
+            if parser is None:
+                parser = JavaParser()
+                app_state.java_parser = parser
             config = getattr(app_state, "config", None)
 
             def _progress(processed: int, total: int, current_file: Optional[str]) -> None:
@@ -154,12 +219,18 @@ def run_index_directory_job(
                     current_file=current_file,
                 )
 
-            methods = scan_java_methods(
-                str(directory),
-                parser,
-                exclude_tests=bool(getattr(config, "index_exclude_tests", True)),
-                progress_callback=_progress,
-            )
+            parse_cache = open_parse_cache(config)
+            try:
+                methods = scan_java_methods(
+                    str(directory),
+                    parser,
+                    exclude_tests=bool(getattr(config, "index_exclude_tests", True)),
+                    progress_callback=_progress,
+                    parse_cache=parse_cache,
+                )
+            finally:
+                if parse_cache is not None:
+                    parse_cache.close()
             if project:
                 for m in methods:
                     m.project = project
@@ -191,169 +262,177 @@ def run_index_directory_job(
                 getattr(config, "project_graph_sqlite_path", "./project_graph.sqlite3")
                 or "./project_graph.sqlite3"
             )
-            graph_store = SqliteProjectGraphStore(sqlite_path=graph_path)
-            graph_store.rebuild(project=project, methods=methods)
-            graph_overview = graph_store.overview_text(project=project)
+            with SqliteProjectGraphStore(sqlite_path=graph_path) as graph_store:
+                graph_store.rebuild(project=project, methods=methods)
+                graph_overview = graph_store.overview_text(project=project)
 
 
             overview_to_store = graph_overview or ""
+            writer = _VectorstoreWriter()
 
             # --- Heuristic File Summaries (Optional) ---
             indexed_summaries = 0
             if include_file_summaries is None:
                 include_file_summaries = bool(getattr(config, "index_file_summaries", False))
 
-            file_summaries_by_path: Dict[str, str] = {}
-            if include_file_summaries:
-                # Call the function with correct arguments (methods list)
-                summaries_map = index_java_file_summaries(
-                    methods=methods,
-                    vectorstore=vectorstore,
-                )
-                indexed_summaries = len(summaries_map)
-                
-                # Convert Dict[(project, path), Document] to Dict[path, content]
-                for (proj, fpath), doc in summaries_map.items():
-                    file_summaries_by_path[str(fpath)] = doc.page_content
-
-            # --- Generic Resource Indexing (YAML, JSON, etc.) ---
-            indexed_resources = 0
-            if getattr(config, "index_resources", True):
-                resource_parser = GenericAppParser()
-                # Get configured extensions and chunk size
-                extensions = getattr(config, "resource_extensions", []) or [
-                    ".yaml", ".yml", ".json", ".xml", ".properties", ".txt", ".md"
-                ]
-                chunk_size = int(getattr(config, "resource_chunk_size", 1000) or 1000)
-                
-                resource_docs = scan_resource_files(
-                    codebase_dir=str(directory),
-                    extensions=extensions,
-                    parser=resource_parser,
-                    chunk_size=chunk_size,
-                    progress_callback=None,  # Or hook into existing progress?
-                )
-                
-                if resource_docs:
-                    # Enrich metadata with project context
-                    for doc in resource_docs:
-                        doc.metadata["project"] = project
-                        doc.metadata["type"] = "resource"
-                        doc.metadata["indexed_at"] = indexed_at
-                        # Ensure language is set (use extension without dot)
-                        ext = doc.metadata.get("extension", "")
-                        doc.metadata["language"] = ext.lstrip(".") if ext else "text"
-
-                    # Add to vectorstore
-                    # Note: we might need to batch this if very large, but Chroma/LangChain handle batching usually.
-                    vectorstore.add_documents(resource_docs)
-                    indexed_resources = len(resource_docs)
-                    
-            # --- Semantic Documentation Generation (Features, Modules, Overview) ---
-            # This step uses an LLM to "understand" the codebase and generate higher-level docs.
-            semantic_overview: Optional[str] = None
-            try:
-                llm = None
-                if os.getenv("OPENAI_API_KEY"):
-                    llm = ChatOpenAI(
-                        model=os.getenv("OPENAI_CHAT_MODEL", "gpt-4o-mini"),
-                        temperature=0,
-                        api_key=os.getenv("OPENAI_API_KEY"),
-                    )
-
-                # Generate features -> modules -> project overview
-                # We need file-level summaries to do this effectively.
-                # If we didn't index them above, we might generate them transiently here (not implemented yet),
-                # or repurpose the ones we just indexed.
-                # simpler approach: we rely on file_summaries_by_path populated above.
-                # If that's empty (because include_file_summaries=False), we might skip or do a lightweight scan.
-                # For now, we reuse the scanned methods map if needed, but better to have summaries.
-
-                # If we have no summaries, let's at least generate them in memory if possible?
-                # The original code passed `file_summaries` (heuristic) to `generate_feature_summary`.
-                # If `file_summaries_by_path` is empty, this step might be weak.
-                # But we proceed.
-
-                # Identify modules (folders with src/main/java or just top-level folders)
-                # For simplicity, we treat subdirectories of 'directory' as modules if they contain java files.
-                # This logic mimics the original behavior.
-
-                # Actually, relying on `file_summaries_by_path` keys (files) to infer structure.
-                # We group files by parent directory.
-                files_by_dir: Dict[str, List[str]] = {}
-                for fpath, summary in file_summaries_by_path.items():
-                    parent = str(Path(fpath).parent)
-                    if parent not in files_by_dir:
-                        files_by_dir[parent] = []
-                    files_by_dir[parent].append(summary)
-
-                # 1. Feature/Module summaries
-                # (This is a simplification of the full logic - we just pass summaries to the generator)
-                # But if we don't have file summaries, we can't do much.
-                # So we only do this if we have summaries.
-                if file_summaries_by_path and llm:
-                    feature_summaries = {}
-                    for folder, summaries in files_by_dir.items():
-                        # We call it "feature" or "module".
-                        # Let's assume each folder is a feature for now.
-                        feat_sum = generate_module_summary(Path(folder), summaries, llm)
-                        feature_summaries[folder] = feat_sum
-
-                    # 2. Project Overview from feature summaries
-                    semantic_overview = generate_project_overview(
-                        str(directory), feature_summaries, llm
-                    ).strip()
-
-                    # 3. Generate Static Docs Site
-                    docs_base = Path(
-                        str(getattr(config, "docs_output_dir", "OUTPUT") or "OUTPUT")
-                    ).expanduser()
-                    if not docs_base.is_absolute():
-                        docs_base = (Path.cwd() / docs_base).resolve()
-
-                    docs_root = (docs_base / project).resolve()
-                    docs_root.mkdir(parents=True, exist_ok=True)
-
-                    docs_site_root = docs_root / "docs"
-                    docs_site_root.mkdir(parents=True, exist_ok=True)
-                    (docs_site_root / "PROJECT_OVERVIEW.md").write_text(
-                        semantic_overview + "\n",
-                        encoding="utf-8",
+            # Summaries are spilled to disk; only one folder's worth is loaded at a time.
+            with FileSummaryStore() as file_summaries_by_path:
+                if include_file_summaries:
+                    # Each summary is written to the store as it is produced.
+                    indexed_summaries = stream_java_file_summaries(
+                        methods,
+                        vectorstore,
+                        file_summaries_by_path,
                     )
 
-                    batch_size = int(getattr(config, "docs_feature_batch_size", 10) or 10)
-                    write_feature_docs_site(
-                        output_dir=docs_site_root,
-                        project_overview=semantic_overview,
-                        file_summaries=file_summaries_by_path,
-                        llm=llm,
-                        batch_size=batch_size,
+                # --- Generic Resource Indexing (YAML, JSON, etc.) ---
+                indexed_resources = 0
+                if getattr(config, "index_resources", True):
+                    resource_parser = GenericAppParser()
+                    # Get configured extensions and chunk size
+                    extensions = getattr(config, "resource_extensions", []) or [
+                        ".yaml", ".yml", ".json", ".xml", ".properties", ".txt", ".md"
+                    ]
+                    chunk_size = int(getattr(config, "resource_chunk_size", 1000) or 1000)
+                
+                    resource_docs = scan_resource_files(
+                        codebase_dir=str(directory),
+                        extensions=extensions,
+                        parser=resource_parser,
+                        chunk_size=chunk_size,
+                        progress_callback=None,  # Or hook into existing progress?
                     )
-
-                    # Index generated markdown docs
-                    index_generated_markdown_docs(
-                        project=project,
-                        docs_root=docs_site_root,
-                        vectorstore=vectorstore,
+                
+                    if resource_docs:
+                        # Enrich metadata with project context
+                        for doc in resource_docs:
+                            doc.metadata["project"] = project
+                            doc.metadata["type"] = "resource"
+                            doc.metadata["indexed_at"] = indexed_at
+                            # Ensure language is set (use extension without dot)
+                            ext = doc.metadata.get("extension", "")
+                            doc.metadata["language"] = ext.lstrip(".") if ext else "text"
+
+                        # Written in the background so embedding overlaps with the LLM phase below.
+                        writer.add_documents(vectorstore, resource_docs)
+                        indexed_resources = len(resource_docs)
+                    
+                # --- Semantic Documentation Generation (Features, Modules, Overview) ---
+                # This step uses an LLM to "understand" the codebase and generate higher-level docs.
+                semantic_overview: Optional[str] = None
+                try:
+                    llm = None
+                    if os.getenv("OPENAI_API_KEY"):
+                        llm = ChatOpenAI(
+                            model=os.getenv("OPENAI_CHAT_MODEL", "gpt-4o-mini"),
+                            temperature=0,
+                            api_key=os.getenv("OPENAI_API_KEY"),
+                        )
+
+                    # Generate features -> modules -> project overview
+                    # We need file-level summaries to do this effectively.
+                    # If we didn't index them above, we might generate them transiently here (not implemented yet),
+                    # or repurpose the ones we just indexed.
+                    # simpler approach: we rely on file_summaries_by_path populated above.
+                    # If that's empty (because include_file_summaries=False), we might skip or do a lightweight scan.
+                    # For now, we reuse the scanned methods map if needed, but better to have summaries.
+
+                    # If we have no summaries, let's at least generate them in memory if possible?
+                    # The original code passed `file_summaries` (heuristic) to `generate_feature_summary`.
+                    # If `file_summaries_by_path` is empty, this step might be weak.
+                    # But we proceed.
+
+                    # Identify modules (folders with src/main/java or just top-level folders)
+                    # For simplicity, we treat subdirectories of 'directory' as modules if they contain java files.
+                    # This logic mimics the original behavior.
+
+                    # 1. Feature/Module summaries
+                    # (This is a simplification of the full logic - we just pass summaries to the generator)
+                    # But if we don't have file summaries, we can't do much.
+                    # So we only do this if we have summaries.
+                    if file_summaries_by_path and llm:
+                        # Relying on `file_summaries_by_path` keys (files) to infer structure:
+                        # group files by parent directory, once all summaries are known.
+                        files_by_dir: Dict[str, List[str]] = {}
+                        # os.path.dirname avoids building a Path per file; keys match str(Path(fpath).parent).
+                        for fpath in file_summaries_by_path:
+                            files_by_dir.setdefault(os.path.dirname(fpath) or ".", []).append(fpath)
+
+                        feature_summaries = {}
+                        for folder, folder_paths in files_by_dir.items():
+                            # We call it "feature" or "module".
+                            # Let's assume each folder is a feature for now.
+                            summaries = file_summaries_by_path.mget(folder_paths)
+                            feat_sum = generate_module_summary(Path(folder), summaries, llm)
+                            feature_summaries[folder] = feat_sum
+
+                        # 2. Project Overview from feature summaries
+                        semantic_overview = generate_project_overview(
+                            str(directory), feature_summaries, llm
+                        ).strip()
+
+                        # 3. Generate Static Docs Site
+                        docs_base = Path(
+                            str(getattr(config, "docs_output_dir", "OUTPUT") or "OUTPUT")
+                        ).expanduser()
+                        if not docs_base.is_absolute():
+                            docs_base = (Path.cwd() / docs_base).resolve()
+
+                        docs_root = (docs_base / project).resolve()
+                        docs_root.mkdir(parents=True, exist_ok=True)
+
+                        docs_site_root = docs_root / "docs"
+                        docs_site_root.mkdir(parents=True, exist_ok=True)
+                        (docs_site_root / "PROJECT_OVERVIEW.md").write_text(
+                            semantic_overview + "\n",
+                            encoding="utf-8",
+                        )
+
+                        batch_size = int(getattr(config, "docs_feature_batch_size", 10) or 10)
+                        write_feature_docs_site(
+                            output_dir=docs_site_root,
+                            project_overview=semantic_overview,
+                            file_summaries=file_summaries_by_path,
+                            llm=llm,
+                            batch_size=batch_size,
+                        )
+
+                        # Index generated markdown docs
+                        def _index_markdown_docs(docs_site_root: Path = docs_site_root) -> None:
+                            try:
+                                index_generated_markdown_docs(
+                                    project=project,
+                                    docs_root=docs_site_root,
+                                    vectorstore=vectorstore,
+                                )
+                            except Exception as e:
+                                logger.warning(
+                                    "Indexing generated docs failed (project=%s): %s", project, e
+                                )
+
+                        writer.submit(_index_markdown_docs)
+
+                except Exception as e:
+                    logger.warning(
+                        "Semantic project overview generation failed (project=%s): %s", project, e
                     )
 
-            except Exception as e:
-                logger.warning(
-                    "Semantic project overview generation failed (project=%s): %s", project, e
-                )
-
             # Update the stored overview if semantic generation succeeded, else fallback to graph
             if semantic_overview:
                 overview_to_store = semantic_overview
                 # Re-index with the newer semantic text
-                index_project_overview(
-                    project=project,
-                    overview_text=overview_to_store,
-                    vectorstore=vectorstore,
-                    indexed_path=str(directory),
-                    indexed_at=indexed_at,
+                writer.submit(
+                    lambda: index_project_overview(
+                        project=project,
+                        overview_text=overview_to_store,
+                        vectorstore=vectorstore,
+                        indexed_path=str(directory),
+                        indexed_at=indexed_at,
+                    )
                 )
 
+            writer.join()
+
             persist = getattr(vectorstore, "persist", None)
             if callable(persist):
                 persist()
@@ -391,6 +470,8 @@ def run_index_directory_job(
                 statuses[project]["loaded_method_docs"] = len(method_docs_map)
                 statuses[project]["indexed_at"] = indexed_at
     except Exception as e:
+        if writer is not None:
+            writer.close()
         finished_at = datetime.now(timezone.utc).isoformat()
         set_indexing_status(
             app_state,
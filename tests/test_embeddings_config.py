@@ -77,3 +77,12 @@ class TestEmbeddingsConfig(unittest.TestCase):
         self.assertIn("texts", captured)
         self.assertEqual(len(captured["texts"]), 1)
         self.assertNotEqual(captured["texts"][0], "hello hello hello hello hello")
+
+    def test_create_embeddings_reuses_client_until_settings_change(self):
+        from core.rag.embeddings import create_embeddings
+
+        first = create_embeddings()
+        self.assertIs(create_embeddings(), first)
+
+        os.environ["OPENAI_API_KEY"] = "sk-other"
+        self.assertIsNot(create_embeddings(), first)
@@ -50,3 +50,27 @@ def test_iter_java_files_can_include_tests_when_disabled() -> None:
 
         files = {p.name for p in iter_java_files(str(root), exclude_tests=False)}
         assert "FooTest.java" in files
+
+
+def test_aiter_java_files_matches_iter_java_files() -> None:
+    import asyncio
+
+    from indexer import aiter_java_files
+
+    async def _collect(root: str, **kwargs) -> set:  # type: ignore[no-untyped-def]
+        return {p async for p in aiter_java_files(root, **kwargs)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+
+        for rel in ("src/main/java/a", "src/main/java/b/c", "src/test/java/a", "build/gen"):
+            (root / rel).mkdir(parents=True)
+            (root / rel / "X.java").write_text("class X {}\n", encoding="utf-8")
+        (root / "src" / "main" / "java" / "a" / "notes.txt").write_text("x\n", encoding="utf-8")
+
+        for exclude_tests in (True, False):
+            expected = set(iter_java_files(str(root), exclude_tests=exclude_tests))
+            found = asyncio.run(_collect(str(root), exclude_tests=exclude_tests, max_concurrency=2))
+            assert found == expected
+
+        assert len(asyncio.run(_collect(str(root)))) == 2
@@ -36,3 +36,68 @@ def test_scan_java_methods_reports_progress_counts() -> None:
         # Last event should show all files processed.
         assert events[-1][0] == 2
         assert events[-1][1] == 2
+
+
+class _RecordingParserStub:
+    def parse_java_file(self, java_code: str, *, file_path: Optional[str] = None):  # type: ignore[no-untyped-def]
+        return [file_path]
+
+
+def test_scan_java_methods_threaded_preserves_file_order() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        src = root / "src" / "main" / "java"
+        src.mkdir(parents=True)
+        for i in range(12):
+            (src / f"C{i}.java").write_text(f"class C{i} {{}}\n", encoding="utf-8")
+
+        sequential = scan_java_methods(str(root), _RecordingParserStub(), max_workers=1)
+
+        events: List[Tuple[int, int, Optional[str]]] = []
+
+        def cb(processed: int, total: int, current: Optional[str]) -> None:
+            events.append((processed, total, current))
+
+        threaded = scan_java_methods(
+            str(root), _RecordingParserStub(), progress_callback=cb, max_workers=4
+        )
+
+        assert len(sequential) == 12
+        assert threaded == sequential
+        # Progress is reported in file order, one event per file plus start/end.
+        assert [e[0] for e in events] == list(range(13)) + [12]
+        assert [e[2] for e in events[1:-1]] == sequential
+
+
+class _CountingParserStub:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def parse_java_file(self, java_code: str, *, file_path: Optional[str] = None):  # type: ignore[no-untyped-def]
+        from core.parsing.java_parser import JavaMethod
+
+        self.calls += 1
+        return [JavaMethod(id="m", signature="void m()", type="method", calls=[], code=java_code, file_path=file_path)]
+
+
+def test_scan_java_methods_reuses_parse_cache_for_unchanged_files() -> None:
+    from core.parsing.parse_cache import SqliteParseCache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "src"
+        root.mkdir()
+        (root / "A.java").write_text("class A {}\n", encoding="utf-8")
+        (root / "B.java").write_text("class B {}\n", encoding="utf-8")
+
+        parser = _CountingParserStub()
+        with SqliteParseCache(sqlite_path=str(Path(tmp) / "cache.sqlite3")) as cache:
+            first = scan_java_methods(str(root), parser, parse_cache=cache)
+            assert parser.calls == 2
+
+            (root / "B.java").write_text("class B { }\n", encoding="utf-8")
+            second = scan_java_methods(str(root), parser, parse_cache=cache)
+
+        # Only the changed file is parsed again.
+        assert parser.calls == 3
+        assert sorted(m.code for m in first) == ["class A {}\n", "class B {}\n"]
+        assert sorted(m.code for m in second) == ["class A {}\n", "class B { }\n"]
@@ -58,6 +58,20 @@ class TestJavaParsingAndAnalysis(unittest.TestCase):
         self.assertIsNotNone(constructor.javadoc)
         self.assertIn("validateConnection", constructor.calls)
 
+    def test_reparse_of_edited_file_matches_fresh_parse(self):
+        from core.parsing.java_parser import JavaParser
+
+        code = self._read_fixture()
+        edited = code.replace("createUser", "createAccount", 1)
+
+        parser = JavaParser()
+        parser.parse_java_file(code, file_path="SampleService.java")
+        incremental = parser.parse_java_file(edited, file_path="SampleService.java")
+        fresh = JavaParser().parse_java_file(edited, file_path="SampleService.java")
+
+        self.assertEqual(incremental, fresh)
+        self.assertTrue(any("createAccount" in m.signature for m in incremental))
+
     def test_indexing_builds_documents_and_metadata(self):
         from langchain_chroma import Chroma
         from langchain_core.embeddings import DeterministicFakeEmbedding
@@ -131,6 +145,56 @@ class TestJavaParsingAndAnalysis(unittest.TestCase):
             self.assertEqual(dep.metadata.get("called_from"), create_user.id)
             self.assertTrue(dep.page_content.startswith("[DEPENDENCY]"))
 
+    def test_batch_retrieval_searches_each_query_once_and_caches(self):
+        from langchain_chroma import Chroma
+        from langchain_core.embeddings import DeterministicFakeEmbedding
+
+        from core.parsing.java_parser import JavaParser
+        from core.rag.indexing import index_java_methods
+        from core.rag.retriever import GraphEnrichedRetriever
+
+        code = self._read_fixture()
+        parser = JavaParser()
+        methods = parser.parse_java_file(code)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            vectorstore = Chroma(
+                collection_name="test_java_methods_batch",
+                embedding_function=DeterministicFakeEmbedding(size=12),
+                persist_directory=tmp,
+            )
+            method_docs_map = index_java_methods(methods, vectorstore)
+
+            create_user = next(m for m in methods if "createUser" in m.signature)
+            primary_doc = method_docs_map[create_user.id]
+
+            searched = []
+
+            def _search(query, k=4, filter=None, **kwargs):
+                searched.append(query)
+                return [primary_doc]
+
+            vectorstore.similarity_search = _search
+
+            retriever = GraphEnrichedRetriever(
+                vectorstore=vectorstore,
+                method_docs_map=method_docs_map,
+                k=1,
+            )
+
+            retriever.get_relevant_documents("create a user")
+            results = retriever.get_relevant_documents_batch(
+                ["create a user", "validate email", "validate email"]
+            )
+            again = retriever.get_relevant_documents_batch(["validate email"])
+
+        # The first query was cached by the single retrieval; the duplicate is searched once.
+        self.assertEqual(searched, ["create a user", "validate email"])
+        self.assertEqual(len(results), 3)
+        for docs in results + again:
+            self.assertEqual(docs[0].metadata["id"], create_user.id)
+            self.assertTrue(any(d.metadata.get("is_dependency") for d in docs))
+
     def test_scan_java_codebase_dir_collects_methods(self):
         from core.parsing.java_parser import JavaParser
         from indexer import scan_java_methods
@@ -147,6 +211,78 @@ class TestJavaParsingAndAnalysis(unittest.TestCase):
         self.assertTrue(any("createUser" in s for s in signatures))
 
 
+class TestMethodIdNormalization(unittest.TestCase):
+    def test_normalize_id_drops_punctuation_and_folds_separators(self):
+        from core.parsing.java_parser import _normalize_id
+
+        raw = "com.example::SampleService::public List<String> find(int id, String q)::l12::src/main/Sample-Service.java"
+        self.assertEqual(
+            _normalize_id(raw),
+            "com_example_sampleservice_public_liststring_findint_id_string_q_l12_src_main_sample_service_java",
+        )
+        self.assertEqual(_normalize_id("  __a -- b__  "), "a_b")
+        self.assertEqual(_normalize_id("()"), "")
+
+
+class TestGraphEnrichment(unittest.TestCase):
+    def test_enrichment_matches_calls_to_whole_signature_tokens(self):
+        from langchain_chroma import Chroma
+        from langchain_core.documents import Document
+        from langchain_core.embeddings import DeterministicFakeEmbedding
+
+        from core.rag.retriever import GraphEnrichedRetriever
+
+        def _doc(mid, signature):
+            return Document(page_content=signature, metadata={"id": mid, "signature": signature})
+
+        method_docs_map = {
+            "get": _doc("get", "public User get(String id)"),
+            "getall": _doc("getall", "public List<User> getAll()"),
+            "save": _doc("save", "public void save(User user)"),
+        }
+        caller = Document(page_content="caller", metadata={"id": "caller", "calls": "get, save"})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            retriever = GraphEnrichedRetriever(
+                vectorstore=Chroma(
+                    collection_name="test_enrich_tokens",
+                    embedding_function=DeterministicFakeEmbedding(size=12),
+                    persist_directory=tmp,
+                ),
+                method_docs_map=method_docs_map,
+            )
+            ids = [d.metadata["id"] for d in retriever._enrich([caller])]
+
+        self.assertEqual(ids, ["caller", "get", "save"])
+
+    def test_reassigned_method_map_of_same_size_rebuilds_index(self):
+        from langchain_chroma import Chroma
+        from langchain_core.documents import Document
+        from langchain_core.embeddings import DeterministicFakeEmbedding
+
+        from core.rag.retriever import GraphEnrichedRetriever
+
+        def _doc(mid, signature):
+            return Document(page_content=signature, metadata={"id": mid, "signature": signature})
+
+        caller = Document(page_content="caller", metadata={"id": "caller", "calls": "save"})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            retriever = GraphEnrichedRetriever(
+                vectorstore=Chroma(
+                    collection_name="test_enrich_reassign",
+                    embedding_function=DeterministicFakeEmbedding(size=12),
+                    persist_directory=tmp,
+                ),
+                method_docs_map={"old": _doc("old", "public void save(User user)")},
+            )
+            before = [d.metadata["id"] for d in retriever._enrich([caller])]
+            # Re-indexing swaps in a new map, possibly of the same size.
+            retriever.method_docs_map = {"new": _doc("new", "public void save(Order order)")}
+            after = [d.metadata["id"] for d in retriever._enrich([caller])]
+
+        self.assertEqual(before, ["caller", "old"])
+        self.assertEqual(after, ["caller", "new"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestSqliteParseCache(unittest.TestCase):
+    def test_roundtrip_is_keyed_by_content_hash(self):
+        from core.parsing.java_parser import JavaMethod
+        from core.parsing.parse_cache import SqliteParseCache
+
+        method = JavaMethod(
+            id="a",
+            signature="public void a()",
+            type="method",
+            calls=["b"],
+            code="void a(){b();}",
+            file_path="src/A.java",
+            start_line=1,
+            end_line=1,
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "parse_cache.sqlite3")
+            code = "class A { void a(){b();} }"
+            digest = SqliteParseCache.content_hash(code)
+
+            with SqliteParseCache(sqlite_path=db_path) as cache:
+                self.assertIsNone(cache.get("src/A.java", digest))
+                cache.put("src/A.java", digest, [method])
+
+            # Persisted across instances.
+            with SqliteParseCache(sqlite_path=db_path) as cache:
+                cached = cache.get("src/A.java", digest)
+                self.assertEqual(cached, [method])
+
+                # Changed content misses.
+                changed = SqliteParseCache.content_hash(code + "\n")
+                self.assertIsNone(cache.get("src/A.java", changed))
+
+
+if __name__ == "__main__":
+    unittest.main()
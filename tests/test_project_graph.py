@@ -53,6 +53,113 @@ class TestProjectGraphStore(unittest.TestCase):
             neigh = store.neighbors_text(project="demo", node_id="demo::a", depth=1, limit=20)
             self.assertIn("Calls:", neigh)
 
+    def test_call_edges_match_whole_signature_tokens(self):
+        from core.parsing.java_parser import JavaMethod
+        from core.project_graph import SqliteProjectGraphStore
+
+        def _m(mid, sig, calls):
+            return JavaMethod(
+                id=mid, signature=sig, type="method", calls=calls, code="", file_path="src/A.java"
+            )
+
+        methods = [
+            _m("caller", "public void caller()", ["get", "save"]),
+            _m("get", "public User get(String id)", []),
+            _m("getall", "public List<User> getAll()", []),
+            _m("save", "public void save(User user)", []),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SqliteProjectGraphStore(sqlite_path=os.path.join(tmp, "graph.sqlite3"))
+            stats = store.rebuild(project="demo", methods=methods)
+
+            # "get" resolves to get(...) only, not to getAll(); "save" resolves to save(...).
+            self.assertEqual(stats.call_edges, 2)
+            neigh = store.neighbors_text(project="demo", node_id="demo::caller", depth=1, limit=20)
+            self.assertIn("public User get(String id)", neigh)
+            self.assertIn("public void save(User user)", neigh)
+            self.assertNotIn("getAll", neigh)
+
+
+    def test_neighbors_fallback_for_old_sqlite_matches(self):
+        import random
+        from unittest import mock
+
+        from core.parsing.java_parser import JavaMethod
+        from core.project_graph import SqliteProjectGraphStore
+        from core.project_graph import sqlite_store
+
+        rng = random.Random(7)
+        names = [f"m{i}" for i in range(30)]
+        methods = [
+            JavaMethod(
+                id=name,
+                signature=f"void {name}()",
+                type="method",
+                calls=sorted(rng.sample(names, 3)),
+                code="",
+                file_path="A.java",
+            )
+            for name in names
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with SqliteProjectGraphStore(sqlite_path=os.path.join(tmp, "graph.sqlite3")) as store:
+                store.rebuild(project="demo", methods=methods)
+                for depth in (1, 2, 3):
+                    current = store.neighbors_text(project="demo", node_id="demo::m0", depth=depth, limit=20)
+                    # Versions before 3.34 reject several recursive SELECTs in one CTE.
+                    with mock.patch.object(sqlite_store.sqlite3, "sqlite_version_info", (3, 31, 1)):
+                        fallback = store.neighbors_text(
+                            project="demo", node_id="demo::m0", depth=depth, limit=20
+                        )
+                    self.assertEqual(fallback, current)
+
+    def test_store_reopens_connection_after_close(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from core.parsing.java_parser import JavaMethod
+        from core.project_graph import SqliteProjectGraphStore
+
+        methods = [
+            JavaMethod(id="a", signature="void a()", type="method", calls=["b"], code="", file_path="A.java"),
+            JavaMethod(id="b", signature="void b()", type="method", calls=[], code="", file_path="A.java"),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with SqliteProjectGraphStore(sqlite_path=os.path.join(tmp, "graph.sqlite3")) as store:
+                store.rebuild(project=None, methods=methods)
+                # The pooled connection is shared across threads.
+                with ThreadPoolExecutor(max_workers=4) as pool:
+                    overviews = list(pool.map(lambda _: store.overview_text(project=None), range(8)))
+                self.assertTrue(all("Call edges (best-effort): 1" in o for o in overviews))
+
+            # Used again after close(): the connection is reopened.
+            self.assertIn("Calls:", store.neighbors_text(project=None, node_id="a"))
+            store.close()
+
+    def test_overview_cache_sees_writes_from_other_stores(self):
+        from core.parsing.java_parser import JavaMethod
+        from core.project_graph import SqliteProjectGraphStore
+
+        def _m(mid, calls):
+            return JavaMethod(id=mid, signature=f"void {mid}()", type="method", calls=calls, code="", file_path="A.java")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "graph.sqlite3")
+            with SqliteProjectGraphStore(sqlite_path=db_path) as reader, SqliteProjectGraphStore(
+                sqlite_path=db_path
+            ) as writer:
+                writer.rebuild(project="demo", methods=[_m("a", []), _m("b", [])])
+                first = reader.overview_text(project="demo")
+                self.assertIn("Call edges (best-effort): 0", first)
+                self.assertIs(reader.overview_text(project="demo"), first)
+
+                writer.rebuild(project="demo", methods=[_m("a", ["b"]), _m("b", [])])
+                self.assertIn("Call edges (best-effort): 1", reader.overview_text(project="demo"))
+
+                reader.rebuild(project="demo", methods=[_m("a", ["b"]), _m("b", ["a"])])
+                self.assertIn("Call edges (best-effort): 2", reader.overview_text(project="demo"))
 
 class TestProjectOverviewIndexing(unittest.TestCase):
     def test_index_project_overview_writes_doc(self):
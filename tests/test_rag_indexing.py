@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _FakeCollection:
+    """In-memory stand-in for a Chroma collection (get/upsert only)."""
+
+    def __init__(self, *, fail_get_ids=(), fail_upsert_ids=()):
+        self.rows = {}
+        self.gets = []
+        self.upserts = []
+        self._fail_get_ids = set(fail_get_ids)
+        self._fail_upsert_ids = set(fail_upsert_ids)
+        self._lock = threading.Lock()
+
+    def get(self, ids, include):
+        self.gets.append(list(ids))
+        if self._fail_get_ids & set(ids):
+            raise RuntimeError("too many SQL variables")
+        found = [i for i in ids if i in self.rows]
+        return {"ids": found, "metadatas": [self.rows[i] for i in found]}
+
+    def upsert(self, ids, documents, metadatas, embeddings=None):
+        if self._fail_upsert_ids & set(ids):
+            raise RuntimeError("upsert failed")
+        with self._lock:
+            self.upserts.append(list(ids))
+            self.rows.update(zip(ids, metadatas))
+
+
+class _FakeVectorstore:
+    embeddings = None
+
+    def __init__(self, collection):
+        self._collection = collection
+
+
+def _methods(count, *, code="return 1;"):
+    from core.parsing.java_parser import JavaMethod
+
+    return [
+        JavaMethod(
+            id=f"m{i}",
+            signature=f"public int m{i}()",
+            type="method",
+            calls=[],
+            code=code,
+            file_path="src/A.java",
+        )
+        for i in range(count)
+    ]
+
+
+class TestIndexJavaMethodsSkipsUnchanged(unittest.TestCase):
+    def test_second_run_writes_nothing_and_changed_method_is_rewritten(self):
+        from core.rag.indexing import index_java_methods
+
+        collection = _FakeCollection()
+        vectorstore = _FakeVectorstore(collection)
+
+        index_java_methods(_methods(5), vectorstore, batch_size=2)
+        written = sorted(i for batch in collection.upserts for i in batch)
+        self.assertEqual(written, [f"m{i}" for i in range(5)])
+
+        collection.upserts.clear()
+        index_java_methods(_methods(5), vectorstore, batch_size=2)
+        self.assertEqual(collection.upserts, [])
+
+        changed = _methods(5)
+        changed[3].code = "return 2;"
+        index_java_methods(changed, vectorstore, batch_size=2)
+        self.assertEqual(collection.upserts, [["m3"]])
+
+    def test_stored_hashes_are_read_in_bounded_chunks(self):
+        from core.rag.indexing import index_java_methods
+
+        collection = _FakeCollection()
+        vectorstore = _FakeVectorstore(collection)
+
+        with mock.patch.dict(os.environ, {"CHROMA_ADD_BATCH_SIZE": "2"}):
+            index_java_methods(_methods(5), vectorstore)
+            collection.gets.clear()
+            collection.upserts.clear()
+            index_java_methods(_methods(5), vectorstore)
+
+        self.assertEqual([len(ids) for ids in collection.gets], [2, 2, 1])
+        self.assertEqual(collection.upserts, [])
+
+    def test_failing_hash_lookup_keeps_only_that_chunk(self):
+        from core.rag.indexing import index_java_methods
+
+        collection = _FakeCollection()
+        vectorstore = _FakeVectorstore(collection)
+
+        with mock.patch.dict(os.environ, {"CHROMA_ADD_BATCH_SIZE": "2"}):
+            index_java_methods(_methods(5), vectorstore)
+            collection.upserts.clear()
+            collection._fail_get_ids = {"m2"}
+            index_java_methods(_methods(5), vectorstore)
+
+        self.assertEqual(sorted(i for batch in collection.upserts for i in batch), ["m2", "m3"])
+
+
+class TestSafeAddDocuments(unittest.TestCase):
+    def _documents(self, count):
+        from langchain_core.documents import Document
+
+        return [Document(page_content=f"doc {i}", metadata={"n": i}) for i in range(count)]
+
+    def test_concurrent_sub_batches_write_every_document(self):
+        from core.rag.indexing import _safe_add_documents
+
+        collection = _FakeCollection()
+        ids = [f"d{i}" for i in range(7)]
+
+        _safe_add_documents(
+            _FakeVectorstore(collection), self._documents(7), ids=ids, batch_size=2, max_workers=4
+        )
+
+        self.assertEqual(sorted(len(batch) for batch in collection.upserts), [1, 2, 2, 2])
+        self.assertEqual(sorted(i for batch in collection.upserts for i in batch), ids)
+
+    def test_failing_sub_batch_is_reraised(self):
+        from core.rag.indexing import _safe_add_documents
+
+        collection = _FakeCollection(fail_upsert_ids={"d3"})
+        ids = [f"d{i}" for i in range(7)]
+
+        with self.assertRaises(RuntimeError):
+            _safe_add_documents(
+                _FakeVectorstore(collection), self._documents(7), ids=ids, batch_size=2, max_workers=4
+            )
+
+        # The other sub-batches still complete before the error surfaces.
+        written = sorted(i for batch in collection.upserts for i in batch)
+        self.assertEqual(written, ["d0", "d1", "d4", "d5", "d6"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestFileSummaryStore(unittest.TestCase):
+    def test_mapping_roundtrip_and_mget(self):
+        from core.documentation.summary_store import FileSummaryStore
+
+        with FileSummaryStore() as store:
+            store["src/A.java"] = "# A"
+            store["src/B.java"] = "# B"
+
+            self.assertEqual(len(store), 2)
+            self.assertIn("src/A.java", store)
+            self.assertNotIn("src/C.java", store)
+            self.assertEqual(store["src/B.java"], "# B")
+            self.assertEqual(sorted(store), ["src/A.java", "src/B.java"])
+
+            # Missing keys are skipped; request order is preserved.
+            self.assertEqual(store.mget(["src/B.java", "src/C.java", "src/A.java"]), ["# B", "# A"])
+
+            del store["src/A.java"]
+            self.assertEqual(list(store), ["src/B.java"])
+
+    def test_close_removes_temp_dir(self):
+        from core.documentation.summary_store import FileSummaryStore
+
+        store = FileSummaryStore()
+        store["x"] = "y"
+        tmp = store._tmpdir.name
+        self.assertTrue(os.path.isdir(tmp))
+
+        store.close()
+        store.close()
+        self.assertFalse(os.path.exists(tmp))
+        with self.assertRaises(ValueError):
+            store["x"]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,22 @@ from pathlib import Path
 from typing import Any, Optional
 
 
+def _merge_results(results: list[list[Any]], k: int) -> list[Any]:
+    """Concatenate the top `k` documents of each result list, dropping duplicates."""
+
+    merged: list[Any] = []
+    seen: set[str] = set()
+    for docs in results:
+        for d in docs[:k]:
+            meta = getattr(d, "metadata", None) or {}
+            key = meta.get("scoped_id") or meta.get("id") or getattr(d, "page_content", "")
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(d)
+    return merged
+
+
 def create_codebase_agent(
     *,
     root_dir: str,
@@ -43,12 +59,14 @@ def create_codebase_agent(
     tools = list(make_codebase_tools(root_dir=resolved_root))
 
     @tool("vector_search")
-    def vector_search(query: str, k: int = 4) -> str:
+    def vector_search(query: str, k: int = 4, more_queries: Optional[list[str]] = None) -> str:
         """Search the indexed codebase (Chroma) and return top matches.
 
         Args:
             query: Natural language query.
-            k: Number of documents to return.
+            k: Number of documents to return per query.
+            more_queries: Optional further queries searched in the same call; their
+                results are merged with those of `query`, without duplicates.
 
         Returns:
             A compact, human-readable list of results.
@@ -66,7 +84,11 @@ def create_codebase_agent(
         try:
             if old_k is not None:
                 setattr(retriever, "k", kk)
-            docs = retriever.get_relevant_documents(str(query))
+            queries = [str(query)] + [str(q) for q in (more_queries or []) if str(q).strip()]
+            if len(queries) > 1 and hasattr(retriever, "get_relevant_documents_batch"):
+                docs = _merge_results(retriever.get_relevant_documents_batch(queries), kk)
+            else:
+                docs = retriever.get_relevant_documents(queries[0])
         except Exception as e:
             return f"ERROR: vector search failed: {e}"
         finally:
@@ -80,7 +102,7 @@ def create_codebase_agent(
             return "(no results)"
 
         blocks = []
-        for i, d in enumerate(docs[:kk], start=1):
+        for i, d in enumerate(docs[: kk * len(queries)], start=1):
             meta = getattr(d, "metadata", None) or {}
             sig = meta.get("signature") or meta.get("scoped_id") or meta.get("id") or "(unknown)"
             fp = meta.get("file_path")
@@ -95,6 +117,13 @@ def create_codebase_agent(
     tools.append(vector_search)
 
     graph_path = str(Path(project_graph_sqlite_path).expanduser().resolve())
+    # Both graph tools share one store (and its pooled connection), opened on first use.
+    graph_store: list[SqliteProjectGraphStore] = []
+
+    def _graph_store() -> SqliteProjectGraphStore:
+        if not graph_store:
+            graph_store.append(SqliteProjectGraphStore(sqlite_path=graph_path))
+        return graph_store[0]
 
     @tool("project_graph_overview")
     def project_graph_overview(project: str = "", limit: int = 25) -> str:
@@ -105,7 +134,7 @@ def create_codebase_agent(
             limit: Max list sizes for top nodes/edges.
         """
 
-        store = SqliteProjectGraphStore(sqlite_path=graph_path)
+        store = _graph_store()
         proj = (project or "").strip() or (default_project or None)
         return store.overview_text(project=proj, limit=int(limit))
 
@@ -120,7 +149,7 @@ def create_codebase_agent(
             limit: Max edges.
         """
 
-        store = SqliteProjectGraphStore(sqlite_path=graph_path)
+        store = _graph_store()
         proj = (project or "").strip() or (default_project or None)
         nid = str(node_id or "").strip()
         if not nid:
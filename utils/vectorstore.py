@@ -7,6 +7,7 @@ from langchain_chroma import Chroma
 from langchain_core.documents import Document
 
 from core.rag.embeddings import create_embeddings
+from core.rag.indexing import _safe_add_documents
 
 
 def _get_vectorstore() -> Chroma:
@@ -129,33 +130,10 @@ def delete_scoped_documents(vectorstore: Chroma, *, project: Optional[str]) -> N
 
 
 def safe_add_documents(vectorstore: Chroma, documents: List[Document], *, ids: Optional[List[str]] = None) -> None:
-    """Add documents with best-effort stable ids.
+    """Add documents with best-effort stable ids, replacing existing ones.
 
-    If the underlying store rejects duplicate ids, this attempts to delete and retry.
+    Thin public alias of `core.rag.indexing._safe_add_documents`, which batches,
+    embeds and upserts the documents.
     """
 
-    if not documents:
-        return
-
-    if ids is None:
-        vectorstore.add_documents(documents)
-        return
-
-    try:
-        vectorstore.add_documents(documents, ids=ids)
-        return
-    except TypeError:
-        vectorstore.add_documents(documents)
-        return
-    except Exception:
-        # Retry by deleting the conflicting ids first.
-        try:
-            vectorstore.delete(ids=ids)
-        except Exception:
-            try:
-                collection = getattr(vectorstore, "_collection")
-                collection.delete(ids=ids)
-            except Exception:
-                raise
-        vectorstore.add_documents(documents, ids=ids)
-
+    _safe_add_documents(vectorstore, documents, ids=ids)